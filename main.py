@@ -6,6 +6,8 @@ Main application entry point with CLI/GUI detection
 
 import sys
 import argparse
+import logging
+import traceback
 from pathlib import Path
 
 # Add src directory to path for imports
@@ -13,24 +15,26 @@ current_dir = Path(__file__).parent
 src_dir = current_dir / "src"
 sys.path.insert(0, str(src_dir))
 
-from gui.main_window import MainWindow
-from core.backup import BackupManager
-from utils.logging import setup_logging
-from utils.config import AppConfig
 
-
-def parse_arguments():
-    """Parse command line arguments"""
-    parser = argparse.ArgumentParser(
-        description="OneDrive Custom Backup Folder Tool",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+EPILOG = """
 Examples:
   python main.py
   python main.py --source "C:\\MyFolder" --target "C:\\Users\\Username\\OneDrive\\Backup\\MyFolder"
   python main.py --source "C:\\MyFolder" --target "C:\\Users\\Username\\OneDrive\\Backup\\MyFolder" --silent
   python main.py --validate-only --source "C:\\MyFolder" --target "C:\\Users\\Username\\OneDrive\\Backup\\MyFolder"
         """
+
+
+def parse_arguments():
+    """Parse command line arguments"""
+    if not sys.argv[1:]:
+        # No arguments, skip argparse entirely and trigger GUI mode
+        return None
+
+    parser = argparse.ArgumentParser(
+        description="OneDrive Custom Backup Folder Tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG
     )
 
     parser.add_argument('--source',
@@ -64,6 +68,9 @@ Examples:
 
 def run_cli_mode(args):
     """Run in command line mode"""
+    from core.backup import BackupManager
+    from utils.logging import setup_logging
+
     logger = setup_logging(verbose=args.verbose)
     backup_manager = BackupManager()
 
@@ -114,7 +121,9 @@ def run_cli_mode(args):
         if not args.silent:
             print(f"Moving '{args.source}' to '{args.target}'...")
 
-        success = backup_manager.execute_backup(args.source, args.target)
+        # Paths were validated above, don't repeat the probes
+        success = backup_manager.execute_backup(
+            args.source, args.target, skip_validation=True)
 
         if success:
             if not args.silent:
@@ -125,7 +134,6 @@ def run_cli_mode(args):
             return False
 
     except Exception as e:
-        import traceback
         logger.error(f"CLI execution error: {e}", exc_info=True)
         print(f"Error: {e}")
         print("\nFull traceback:")
@@ -136,13 +144,15 @@ def run_cli_mode(args):
 def run_gui_mode():
     """Run in GUI mode"""
     try:
+        from gui.main_window import MainWindow
+        from utils.logging import setup_logging
+
         setup_logging()
         app = MainWindow()
         app.run()
         return True
     except Exception as e:
         # For console debugging, print full traceback
-        import traceback
         error_msg = f"GUI Error: {e}"
         print(error_msg)
         print("\nFull traceback:")
@@ -150,7 +160,6 @@ def run_gui_mode():
         
         # Also log the error
         try:
-            import logging
             logger = logging.getLogger(__name__)
             logger.error(f"GUI startup failed: {e}", exc_info=True)
         except:
@@ -181,15 +190,14 @@ def main():
             sys.exit(0 if success else 1)
             
     except Exception as e:
-        import traceback
         print(f"Fatal Error: {e}")
         print("\nFull traceback:")
         traceback.print_exc()
         
         # Try to log the error if possible
         try:
+            from utils.logging import setup_logging
             setup_logging()
-            import logging
             logger = logging.getLogger(__name__)
             logger.critical(f"Application startup failed: {e}", exc_info=True)
         except:
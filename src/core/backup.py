@@ -5,12 +5,68 @@ Core backup functionality for OneDrive Custom Backup Tool
 import os
 import sys
 import logging
+import subprocess
+import threading
 from pathlib import Path
-from typing import Tuple, Optional, Callable
+from typing import Tuple, Optional, Callable, Dict, List
 
 from core.powershell import PowerShellExecutor
 from core.rollback import RollbackManager
-from utils.paths import PathUtils
+from utils.paths import PathUtils, fast_isdir
+
+
+class _OperationCache:
+    """Memoizes junction probes for the duration of a single backup operation"""
+
+    def __init__(self, path_utils: PathUtils):
+        self.path_utils = path_utils
+        self.active = False
+        self._junction_info: Dict[str, Tuple[bool, Optional[str]]] = {}
+        self._target_state: Dict[str, dict] = {}
+
+    def begin(self):
+        """Start caching for a new operation"""
+        self._junction_info.clear()
+        self._target_state.clear()
+        self.active = True
+
+    def end(self):
+        """Stop caching and drop all entries"""
+        self._junction_info.clear()
+        self._target_state.clear()
+        self.active = False
+
+    def invalidate(self, path: str):
+        """Forget cached state for a path whose junction status changed"""
+        self._junction_info.pop(os.path.normcase(path), None)
+
+    def remember_target_state(self, path: str, state: Optional[dict]):
+        """Keep what target validation found, see PathUtils.validate_target_path_detailed"""
+        if self.active and state is not None:
+            self._target_state[os.path.normcase(path)] = state
+
+    def target_is_dir(self, path: str) -> bool:
+        """Whether the target is an existing directory, reusing validation's answer"""
+        state = self._target_state.get(os.path.normcase(path))
+        if state is None:
+            # One attribute query covers both exists() and is_dir()
+            return fast_isdir(path)
+        return state['existed']
+
+    def get_junction_info(self, path: str) -> Tuple[bool, Optional[str]]:
+        """Return (is_junction, target), probing the filesystem at most once per operation"""
+        if not self.active:
+            return self.path_utils.get_junction_info_atomic(path)
+
+        key = os.path.normcase(path)
+        if key not in self._junction_info:
+            self._junction_info[key] = self.path_utils.get_junction_info_atomic(
+                path)
+        return self._junction_info[key]
+
+    def is_junction(self, path: str) -> bool:
+        """Check if path is a junction point"""
+        return self.get_junction_info(path)[0]
 
 
 class BackupManager:
@@ -21,6 +77,10 @@ class BackupManager:
         self.powershell = PowerShellExecutor()
         self.rollback_manager = RollbackManager()
         self.path_utils = PathUtils()
+        self._op_cache = _OperationCache(self.path_utils)
+        # Outcome of the rollback run by the last execute_backup, None if it
+        # did not need one
+        self.last_rollback: Optional[bool] = None
 
     def validate_paths(self, source: str, target: str) -> Tuple[bool, str]:
         """
@@ -41,13 +101,14 @@ class BackupManager:
                 return False, f"Source path error: {source_error}"
 
             # Validate target path
-            target_valid, target_error = self.path_utils.validate_target_path(
-                target)
+            target_valid, target_error, target_state = \
+                self.path_utils.validate_target_path_detailed(target)
             if not target_valid:
                 return False, f"Target path error: {target_error}"
+            self._op_cache.remember_target_state(target, target_state)
 
             # Check if source is already a junction
-            if self.path_utils.is_junction(source):
+            if self._op_cache.is_junction(source):
                 return False, "Source path is already a junction link"
 
             # Additional checks can be added here if needed
@@ -60,7 +121,9 @@ class BackupManager:
             return False, f"Validation error: {str(e)}"
 
     def execute_backup(self, source: str, target: str,
-                       progress_callback: Optional[Callable[[str, int], None]] = None) -> bool:
+                       progress_callback: Optional[Callable[[str, int], None]] = None,
+                       skip_validation: bool = False,
+                       cancel_event: Optional[threading.Event] = None) -> bool:
         """
         Execute backup process: Move folder to OneDrive and create junction
 
@@ -68,20 +131,28 @@ class BackupManager:
             source: Source folder path
             target: Target OneDrive path
             progress_callback: Optional callback for progress updates
+            skip_validation: Skip path validation when the caller has just run validate_paths
+            cancel_event: Optional event that stops the backup before its next step
 
         Returns:
             True if successful, False otherwise
         """
+        self._op_cache.begin()
+        self.last_rollback = None
         try:
             self.logger.info(f"Starting backup: {source} -> {target}")
 
             # Step 1: Validate paths
-            if progress_callback:
-                progress_callback("Validating paths...", 10)
+            if not skip_validation:
+                if progress_callback:
+                    progress_callback("Validating paths...", 10)
+
+                is_valid, error_msg = self.validate_paths(source, target)
+                if not is_valid:
+                    self.logger.error(f"Validation failed: {error_msg}")
+                    return False
 
-            is_valid, error_msg = self.validate_paths(source, target)
-            if not is_valid:
-                self.logger.error(f"Validation failed: {error_msg}")
+            if self._cancelled(cancel_event):
                 return False
 
             # Step 2: Prepare rollback point
@@ -93,7 +164,7 @@ class BackupManager:
             target_path = Path(target)
 
             # If target is an existing directory, the actual target will be target/source_folder_name
-            if target_path.exists() and target_path.is_dir():
+            if self._op_cache.target_is_dir(target):
                 actual_target = target_path / source_path.name
                 actual_target_str = str(actual_target)
                 self.logger.info(
@@ -104,6 +175,11 @@ class BackupManager:
             self.rollback_manager.create_rollback_point(
                 source, actual_target_str)
 
+            if self._cancelled(cancel_event):
+                # Nothing has been moved yet
+                self.rollback_manager.clear_rollback_point()
+                return False
+
             # Step 3: Move folder to OneDrive
             if progress_callback:
                 progress_callback("Moving files to OneDrive...", 50)
@@ -113,17 +189,33 @@ class BackupManager:
                 self.logger.error("Failed to move folder to OneDrive")
                 if progress_callback:
                     progress_callback("Move failed, rolling back...", 30)
-                self.rollback_manager.rollback()
+                self._rollback()
+                return False
+
+            # The folder now lives at the target, rollback must move it back
+            self.rollback_manager.update_rollback_status(backup_created=True)
+
+            if self._cancelled(cancel_event):
+                if progress_callback:
+                    progress_callback("Cancelled, rolling back...", 30)
+                self._rollback()
                 return False
 
             # Step 4: Create junction link
             if progress_callback:
                 progress_callback("Creating junction link...", 80)
 
-            junction_success = self._create_junction(source, actual_target_str)
-            if not junction_success:
+            junction_created, junction_verified = self._create_junction(
+                source, actual_target_str)
+            if junction_created:
+                # Rollback must remove the junction before moving the folder
+                # back, even when the junction failed verification below
+                self.rollback_manager.update_rollback_status(
+                    junction_created=True)
+
+            if not junction_verified:
                 self.logger.error("Failed to create junction")
-                self.rollback_manager.rollback()
+                self._rollback()
                 return False
 
             # Step 5: Verify result
@@ -132,7 +224,7 @@ class BackupManager:
 
             if not self._verify_backup(source, actual_target_str):
                 self.logger.error("Backup verification failed")
-                self.rollback_manager.rollback()
+                self._rollback()
                 return False
 
             if progress_callback:
@@ -144,9 +236,25 @@ class BackupManager:
 
         except Exception as e:
             self.logger.error(f"Backup execution error: {e}")
-            self.rollback_manager.rollback()
+            self._rollback()
             return False
 
+        finally:
+            self._op_cache.end()
+            # Source and target changed on disk, don't reuse their validation
+            self.path_utils.clear_validation_cache()
+
+    def _rollback(self):
+        """Undo the steps recorded in the rollback point, keeping the outcome in last_rollback"""
+        self.last_rollback = self.rollback_manager.rollback()
+
+    def _cancelled(self, cancel_event: Optional[threading.Event]) -> bool:
+        """Check whether the caller asked to stop the backup"""
+        if cancel_event is not None and cancel_event.is_set():
+            self.logger.info("Backup cancelled")
+            return True
+        return False
+
     def _move_folder(self, source: str, target: str) -> bool:
         """Move folder using PowerShell Move-Item command with better error handling"""
         try:
@@ -156,7 +264,7 @@ class BackupManager:
             target_path = Path(target)
 
             # If target is an existing directory, move source inside it
-            if target_path.exists() and target_path.is_dir():
+            if self._op_cache.target_is_dir(target):
                 # Create the final target path: target/source_folder_name
                 final_target = target_path / source_path.name
                 self.logger.info(
@@ -177,9 +285,11 @@ class BackupManager:
                 return False
 
             # First try standard move
-            command = f'Move-Item "{source}" "{target}" -Force'
-            self.logger.info(f"Executing: {command}")
-            success, stdout, stderr = self.powershell.run_command(command)
+            self.logger.info(
+                f"Executing: Move-Item -LiteralPath '{source}' -Destination '{target}' -Force")
+            success, stdout, stderr = self.powershell.run_script(
+                'param($Source, $Target) Move-Item -LiteralPath $Source -Destination $Target -Force',
+                [source, target])
 
             if success:
                 # Verify move was successful
@@ -201,14 +311,15 @@ class BackupManager:
             self.logger.info(
                 "Attempting robocopy method for better permission handling...")
 
-            # Use robocopy to copy files, then remove source
-            copy_command = f'robocopy "{source}" "{target}" /E /MOVE /R:3 /W:10 /MT:8'
-            self.logger.info(f"Executing: {copy_command}")
-            success, stdout, stderr = self.powershell.run_command(
-                copy_command, timeout=120)
+            # Use robocopy to copy files, then remove source. Run it directly
+            # rather than through PowerShell, with per-file logging suppressed.
+            robocopy_args = ["robocopy", source, target,
+                             "/E", "/MOVE", "/R:3", "/W:10", "/MT:8",
+                             "/NP", "/NFL", "/NDL", "/NJH", "/NJS"]
+            self.logger.info(f"Executing: {' '.join(robocopy_args)}")
+            success, stderr = self._run_robocopy(robocopy_args, timeout=120)
 
-            # Robocopy returns various exit codes, 0-7 are success, 8+ are errors
-            if success or "ERROR" not in stderr:
+            if success:
                 # Check if target exists and source is gone
                 if target_path.exists() and not source_path.exists():
                     self.logger.info("Robocopy move completed successfully")
@@ -217,9 +328,9 @@ class BackupManager:
                     # Files copied but source still exists, try to remove source
                     self.logger.info(
                         "Files copied, attempting to remove source...")
-                    remove_command = f'Remove-Item "{source}" -Recurse -Force'
-                    remove_success, _, remove_error = self.powershell.run_command(
-                        remove_command)
+                    remove_success, _, remove_error = self.powershell.run_script(
+                        'param($Path) Remove-Item -LiteralPath $Path -Recurse -Force',
+                        [source])
 
                     if remove_success or not Path(source).exists():
                         return True
@@ -236,28 +347,72 @@ class BackupManager:
             self.logger.error(f"Move folder error: {e}")
             return False
 
-    def _create_junction(self, source: str, target: str) -> bool:
-        """Create junction link using PowerShell New-Item command"""
+    def _run_robocopy(self, args: List[str], timeout: int) -> Tuple[bool, str]:
+        """
+        Run robocopy without a shell or PowerShell wrapper
+
+        Args:
+            args: robocopy argv
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple of (success, error_output)
+        """
+        try:
+            process = subprocess.run(
+                args,
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+
+            # Robocopy returns various exit codes, 0-7 are success, 8+ are errors
+            success = process.returncode < 8
+            output = (process.stderr or process.stdout or "").strip()
+            if not success:
+                self.logger.error(
+                    f"Robocopy failed with exit code {process.returncode}: {output}")
+            return success, output
+
+        except subprocess.TimeoutExpired:
+            self.logger.error(f"Robocopy timeout after {timeout} seconds")
+            return False, "Command timeout"
+
+        except OSError as e:
+            self.logger.error(f"Could not run robocopy: {e}")
+            return False, str(e)
+
+    def _create_junction(self, source: str, target: str) -> Tuple[bool, bool]:
+        """Create junction link natively by setting a mount point reparse point
+
+        Returns:
+            Tuple of (created, verified). created is True once the mount point
+            was set, so rollback knows to remove it even if verification fails.
+        """
+        created = False
         try:
-            # Execute PowerShell New-Item Junction command
-            command = f'New-Item -ItemType Junction -Path "{source}" -Target "{target}"'
-            success, stdout, stderr = self.powershell.run_command(command)
+            success, error = self.path_utils.create_junction(source, target)
 
             if not success:
-                self.logger.error(f"New-Item Junction failed: {stderr}")
-                return False
+                self.logger.error(f"Junction creation failed: {error}")
+                return False, False
+
+            created = True
+
+            # Junction state of source just changed
+            self._op_cache.invalidate(source)
 
             # Verify junction was created
-            if not self.path_utils.is_junction(source):
+            if not self._op_cache.is_junction(source):
                 self.logger.error(
                     "Junction creation completed but junction doesn't exist")
-                return False
+                return True, False
 
-            return True
+            return True, True
 
         except Exception as e:
             self.logger.error(f"Create junction error: {e}")
-            return False
+            return created, False
 
     def _verify_backup(self, source: str, target: str) -> bool:
         """Verify backup was created successfully"""
@@ -265,8 +420,12 @@ class BackupManager:
             self.logger.info(
                 f"Verifying backup: source={source}, target={target}")
 
+            # Check junction status and read its target in one probe
+            is_junction, junction_target = \
+                self._op_cache.get_junction_info(source)
+
             # Check if source is now a junction
-            if not self.path_utils.is_junction(source):
+            if not is_junction:
                 self.logger.error(f"Source is not a junction: {source}")
                 return False
             else:
@@ -280,7 +439,6 @@ class BackupManager:
                 self.logger.info(f"SUCCESS: Target exists: {target}")
 
             # Check if junction points to correct target
-            junction_target = self.path_utils.get_junction_target(source)
             if not junction_target:
                 self.logger.error(
                     f"Could not get junction target for: {source}")
@@ -289,22 +447,20 @@ class BackupManager:
             self.logger.info(f"Junction target: {junction_target}")
             self.logger.info(f"Expected target: {target}")
 
-            # Compare resolved paths
-            try:
-                junction_resolved = Path(junction_target).resolve()
-                target_resolved = Path(target).resolve()
-
-                if junction_resolved != target_resolved:
-                    self.logger.error(
-                        f"Junction target mismatch: {junction_resolved} != {target_resolved}")
-                    return False
-                else:
-                    self.logger.info(
-                        f"SUCCESS: Junction points to correct target")
+            # Compare normalized paths; the reparse target is stored literally,
+            # so resolving through the filesystem is unnecessary
+            junction_normalized = os.path.normcase(
+                os.path.normpath(junction_target))
+            target_normalized = os.path.normcase(
+                os.path.normpath(os.path.abspath(target)))
 
-            except Exception as e:
-                self.logger.error(f"Error resolving paths: {e}")
+            if junction_normalized != target_normalized:
+                self.logger.error(
+                    f"Junction target mismatch: {junction_normalized} != {target_normalized}")
                 return False
+            else:
+                self.logger.info(
+                    f"SUCCESS: Junction points to correct target")
 
             self.logger.info("SUCCESS: Backup verification passed")
             return True
@@ -4,20 +4,53 @@ Junction Link Manager for OneDrive Custom Backup Tool
 
 import os
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Tuple
-import subprocess
+from typing import Iterator, List, Dict, Tuple
 
-from core.powershell import PowerShellExecutor
 from utils.paths import PathUtils
 
 
+@functools.lru_cache(maxsize=1)
+def _default_search_paths() -> Tuple[str, ...]:
+    """Default junction search paths, computed once per process"""
+    home = Path.home()
+    return (
+        str(home / "Documents"),
+        str(home / "Desktop"),
+        str(home / "Downloads"),
+        str(home / "Pictures"),
+        str(home / "Videos"),
+        str(home / "Music"),
+        "C:\\Program Files",
+        "C:\\Program Files (x86)",
+        "C:\\Users",
+        "D:\\",
+    )
+
+
+# Search roots seen to exist; misses are not kept so that drives plugged
+# in later (e.g. D:\) are picked up by the next listing
+_existing_search_roots = set()
+
+
+def _search_root_exists(path: str) -> bool:
+    """Whether a search root exists, remembering roots once they are found"""
+    if path in _existing_search_roots:
+        return True
+    if os.path.exists(path):
+        _existing_search_roots.add(path)
+        return True
+    return False
+
+
 class JunctionManager:
     """Manages junction links - listing, removing, and maintaining them"""
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.powershell = PowerShellExecutor()
         self.path_utils = PathUtils()
 
     def list_junctions(self, search_paths: List[str] = None) -> List[Dict]:
@@ -32,29 +65,25 @@ class JunctionManager:
         """
         try:
             if search_paths is None:
-                # Default search paths
-                search_paths = [
-                    str(Path.home() / "Documents"),
-                    str(Path.home() / "Desktop"),
-                    str(Path.home() / "Downloads"),
-                    str(Path.home() / "Pictures"),
-                    str(Path.home() / "Videos"),
-                    str(Path.home() / "Music"),
-                    "C:\\Program Files",
-                    "C:\\Program Files (x86)",
-                    "C:\\Users",
-                    "D:\\",
-                ]
+                search_paths = _default_search_paths()
+
+            existing_paths = [p for p in search_paths if _search_root_exists(p)]
+            if not existing_paths:
+                return []
 
+            # Search roots are independent and I/O bound, so scan them concurrently
             junctions = []
-            for search_path in search_paths:
-                try:
-                    if os.path.exists(search_path):
-                        junctions.extend(
-                            self._find_junctions_in_path(search_path))
-                except Exception as e:
-                    self.logger.warning(
-                        f"Error searching in {search_path}: {e}")
+            with ThreadPoolExecutor(max_workers=min(8, len(existing_paths))) as executor:
+                futures = [(search_path, executor.submit(self._find_junctions_in_path, search_path))
+                           for search_path in existing_paths]
+
+                # Collect in submission order to keep the listing stable
+                for search_path, future in futures:
+                    try:
+                        junctions.extend(future.result())
+                    except Exception as e:
+                        self.logger.warning(
+                            f"Error searching in {search_path}: {e}")
 
             return junctions
 
@@ -75,50 +104,68 @@ class JunctionManager:
         """
         junctions = []
         try:
-            # Use PowerShell to find junctions efficiently
-            # Ensure path ends with backslash for proper root directory handling
-            if path.endswith(':'):
-                search_path = path + '\\'
-            elif not path.endswith('\\'):
-                search_path = path + '\\'
-            else:
-                search_path = path
-
-            ps_command = f"""Get-ChildItem -Path '{search_path}' -Recurse -Depth {max_depth} -Force -ErrorAction SilentlyContinue | Where-Object {{ $_.LinkType -eq 'Junction' }} | Select-Object FullName, Target, CreationTime | ConvertTo-Json -Depth 3"""
-
-            success, output, error = self.powershell.run_command(ps_command)
-
-            if success and output:
-                import json
-                try:
-                    # Handle single object or array
-                    data = json.loads(output)
-                    if isinstance(data, dict):
-                        data = [data]
-
-                    for item in data:
-                        target = item.get('Target', '')
-                        # Handle both string and array formats
-                        if isinstance(target, list):
-                            target = target[0] if target else ''
-
-                        junction_info = {
-                            'source': item.get('FullName', ''),
-                            'target': target,
-                            'created': item.get('CreationTime', ''),
-                            'type': 'Junction'
-                        }
-                        junctions.append(junction_info)
-
-                except json.JSONDecodeError:
-                    self.logger.warning(
-                        f"Could not parse PowerShell output for {path}")
-
+            junctions.extend(self._iter_junctions_in_path(path, max_depth))
         except Exception as e:
             self.logger.error(f"Error finding junctions in {path}: {e}")
 
         return junctions
 
+    def _iter_junctions_in_path(self, path: str, max_depth: int = 1) -> Iterator[Dict]:
+        """
+        Yield junction links in a specific path as they are found
+
+        Args:
+            path: Path to search
+            max_depth: Maximum depth to search
+
+        Yields:
+            Junction information dictionaries, one entry at a time
+        """
+        # Ensure path ends with backslash for proper root directory handling
+        if path.endswith(':'):
+            search_path = path + '\\'
+        else:
+            search_path = path
+
+        # Depth-first with an explicit stack so only one directory
+        # listing is held open at a time
+        pending = [(search_path, 0)]
+        while pending:
+            directory, depth = pending.pop()
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if self.path_utils.is_junction_entry(entry):
+                            yield self._junction_entry_info(entry)
+                        elif (depth < max_depth and entry.is_dir(follow_symlinks=False)
+                              and not self.path_utils.is_link_entry(entry)):
+                            # Never descend through links, they can loop back
+                            # up the tree (e.g. AppData\Local\Application Data)
+                            subdirs.append(entry.path)
+            except OSError:
+                # Skip directories we cannot read
+                continue
+
+            # Reverse so subdirectories are visited in listing order
+            pending.extend((subdir, depth + 1) for subdir in reversed(subdirs))
+
+    def _junction_entry_info(self, entry: os.DirEntry) -> Dict:
+        """Build junction information from a directory entry"""
+        _, target = self.path_utils.get_junction_info_atomic(entry.path)
+        try:
+            created = datetime.fromtimestamp(
+                entry.stat(follow_symlinks=False).st_ctime).strftime('%Y-%m-%d %H:%M:%S')
+        except OSError:
+            created = ''
+
+        return {
+            'source': entry.path,
+            'target': target or '',
+            'created': created,
+            'type': 'Junction'
+        }
+
     def remove_junction(self, junction_path: str) -> Tuple[bool, str]:
         """
         Remove a junction link
@@ -136,9 +183,8 @@ class JunctionManager:
             if not self.path_utils.is_junction(junction_path):
                 return False, "Path is not a junction link"
 
-            # Remove the junction using PowerShell
-            ps_command = f'Remove-Item -Path "{junction_path}" -Force'
-            success, output, error = self.powershell.run_command(ps_command)
+            # Remove the reparse point natively
+            success, error = self.path_utils.remove_junction(junction_path)
 
             if success:
                 self.logger.info(
@@ -163,15 +209,11 @@ class JunctionManager:
             Dictionary with junction information
         """
         try:
-            if not self.path_utils.is_junction(path):
-                return {}
-
-            # Get junction target using PowerShell
-            ps_command = f'(Get-Item "{path}").Target'
-            success, output, error = self.powershell.run_command(ps_command)
+            # Read junction status and target natively from the reparse point
+            is_junction, target = self.path_utils.get_junction_info_atomic(
+                path)
 
-            if success and output:
-                target = output.strip()
+            if is_junction and target:
                 return {
                     'source': path,
                     'target': target,
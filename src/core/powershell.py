@@ -4,15 +4,222 @@ PowerShell command execution for OneDrive Custom Backup Tool
 
 import subprocess
 import logging
-from typing import Tuple
+import atexit
+import functools
+import queue
+import threading
+import uuid
+from typing import Optional, Sequence, Tuple
 import sys
 
+try:
+    # Optional SIMD codec, API compatible with the standard library
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _shell32 = ctypes.WinDLL("shell32", use_last_error=True)
+
+    _ShellExecuteW = _shell32.ShellExecuteW
+    _ShellExecuteW.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR,
+                               wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_int]
+    _ShellExecuteW.restype = wintypes.HINSTANCE
+
+    _IsUserAnAdmin = _shell32.IsUserAnAdmin
+    _IsUserAnAdmin.argtypes = []
+    _IsUserAnAdmin.restype = wintypes.BOOL
+
+
+# Marks the end of each command's output on the persistent host's stdout.
+# Random per process so nothing a command prints can be mistaken for it.
+_END_MARKER = f"__ODBT_END_{uuid.uuid4().hex}__"
+
+# Runs one base64-encoded command inside the host and reports its result on a
+# single marker line: "<marker> <ok> <base64 stdout> <base64 stderr>".
+# Everything must stay on one line because the host reads stdin line by line.
+_HOST_COMMAND_TEMPLATE = (
+    "$__ok = $true; $__out = @(); $__err = @(); "
+    "try {{ "
+    "$global:LASTEXITCODE = 0; "
+    "$__cmd = [Text.Encoding]::Unicode.GetString([Convert]::FromBase64String('{encoded}')); "
+    "foreach ($__r in @(Invoke-Expression $__cmd 2>&1)) {{ "
+    "if ($__r -is [Management.Automation.ErrorRecord]) {{ $__ok = $false; $__err += $__r.ToString() }} "
+    "else {{ $__out += ($__r | Out-String).TrimEnd() }} }}; "
+    "if ($LASTEXITCODE -ne 0) {{ $__ok = $false }} "
+    "}} catch {{ $__ok = $false; $__err += $_.ToString() }}; "
+    "[Console]::Out.WriteLine('{marker} ' + [int]$__ok + ' ' + "
+    "[Convert]::ToBase64String([Text.Encoding]::UTF8.GetBytes(($__out -join \"`n\"))) + ' ' + "
+    "[Convert]::ToBase64String([Text.Encoding]::UTF8.GetBytes(($__err -join \"`n\")))); "
+    "[Console]::Out.Flush()"
+)
+
+
+_ADMIN_CHECK_COMMAND = (
+    "([Security.Principal.WindowsPrincipal] "
+    "[Security.Principal.WindowsIdentity]::GetCurrent()).IsInRole("
+    "[Security.Principal.WindowsBuiltInRole]::Administrator)"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _encode_command(command: str) -> str:
+    """Encode a command for -EncodedCommand, cached for repeated probes"""
+    return base64.b64encode(command.encode('utf-16le')).decode('ascii')
+
+
+# PowerShell treats the typographic single quotes like ' inside literals
+_SINGLE_QUOTES = ("'", "\u2018", "\u2019", "\u201a", "\u201b")
+
+
+def _quote_literal(value: str) -> str:
+    """Quote a value as a PowerShell single-quoted string literal"""
+    for quote in _SINGLE_QUOTES:
+        value = value.replace(quote, quote * 2)
+    return f"'{value}'"
+
+
+class _PowerShellHost:
+    """A long-lived powershell.exe that runs commands sent over stdin"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._process = None
+        self._lines = None
+        self._unavailable = False
+
+    def _start(self) -> bool:
+        """Start the host process, returns False if PowerShell cannot be started"""
+        try:
+            creationflags = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+            self._process = subprocess.Popen(
+                ['powershell.exe', '-NoLogo', '-NoProfile', '-NonInteractive',
+                    '-ExecutionPolicy', 'Bypass', '-Command', '-'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                creationflags=creationflags
+            )
+        except OSError as e:
+            self.logger.warning("Persistent PowerShell host unavailable: %s", e)
+            self._unavailable = True
+            return False
+
+        self._lines = queue.Queue()
+        reader = threading.Thread(
+            target=self._read_output, args=(self._process.stdout, self._lines), daemon=True)
+        reader.start()
+
+        # Keep progress records and console encoding from polluting the output
+        self._write("$ProgressPreference = 'SilentlyContinue'; "
+                    "[Console]::OutputEncoding = [Text.Encoding]::UTF8")
+        return True
+
+    @staticmethod
+    def _read_output(stream, lines: queue.Queue):
+        """Forward host stdout lines to the queue, None signals end of stream"""
+        try:
+            for line in stream:
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        lines.put(None)
+
+    def _write(self, line: str):
+        self._process.stdin.write(line + "\n")
+        self._process.stdin.flush()
+
+    def _kill(self):
+        """Terminate the host, it is restarted on the next command"""
+        if self._process is not None:
+            try:
+                self._process.kill()
+                self._process.wait(timeout=5)
+            except Exception:
+                pass
+        self._process = None
+        self._lines = None
+
+    def run(self, command: str, timeout: int) -> Optional[Tuple[int, str, str]]:
+        """
+        Run a command in the host
+
+        Args:
+            command: PowerShell command to execute
+            timeout: Command timeout in seconds
+
+        Returns:
+            Tuple of (returncode, stdout, stderr), or None if the host is unavailable
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time
+        """
+        if self._unavailable:
+            return None
+
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                if not self._start():
+                    return None
+
+            encoded = _encode_command(command)
+            try:
+                self._write(_HOST_COMMAND_TEMPLATE.format(
+                    encoded=encoded, marker=_END_MARKER))
+            except OSError as e:
+                self._kill()
+                return 1, "", f"PowerShell host error: {e}"
+
+            while True:
+                try:
+                    line = self._lines.get(timeout=timeout)
+                except queue.Empty:
+                    # The host is stuck on this command, discard it
+                    self._kill()
+                    raise subprocess.TimeoutExpired(command, timeout)
+
+                if line is None:
+                    self._kill()
+                    return 1, "", "PowerShell host exited unexpectedly"
+
+                if line.startswith(_END_MARKER):
+                    _, ok, out, err = line.rstrip('\r\n').split(' ')
+                    stdout = base64.b64decode(out).decode('utf-8')
+                    stderr = base64.b64decode(err).decode('utf-8')
+                    return (0 if ok == '1' else 1), stdout, stderr
+
+                # Anything else was written straight to the host, not the pipeline
+
+    def close(self):
+        """Ask the host to exit, killing it if it does not"""
+        with self._lock:
+            if self._process is None:
+                return
+            try:
+                self._write("exit")
+                self._process.wait(timeout=2)
+            except Exception:
+                pass
+            self._kill()
+
+
+_host = _PowerShellHost()
+atexit.register(_host.close)
+
 
 class PowerShellExecutor:
     """Handles PowerShell command execution with proper error handling"""
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self._is_admin: Optional[bool] = None
+        self._is_available: Optional[bool] = None
 
     def run_command(self, command: str, timeout: int = 30) -> Tuple[bool, str, str]:
         """
@@ -26,109 +233,95 @@ class PowerShellExecutor:
             Tuple of (success, stdout, stderr)
         """
         try:
-            self.logger.info(f"Executing PowerShell command: {command}")
-
-            # Use base64 encoding for complex commands to avoid quote issues
-            import base64
-            encoded_command = base64.b64encode(command.encode('utf-16le')).decode('ascii')
-            full_command = f'powershell.exe -EncodedCommand "{encoded_command}"'
-
-            # Execute command
-            process = subprocess.run(
-                full_command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                encoding='utf-8'
-            )
+            self.logger.info("Executing PowerShell command: %s", command)
 
-            stdout = process.stdout.strip()
-            stderr = process.stderr.strip()
-            success = process.returncode == 0
+            # All commands share one persistent PowerShell process
+            result = _host.run(command, timeout)
+            if result is None:
+                self.logger.error("PowerShell is not available")
+                return False, "", "PowerShell is not available"
 
-            # Clean up XML progress output that PowerShell sometimes includes
-            if stdout and stdout.startswith('#< CLIXML'):
-                # Extract actual content from XML if any
-                try:
-                    import re
-                    # Look for actual output between XML tags
-                    match = re.search(r'<S[^>]*>([^<]+)</S>', stdout)
-                    if match and not 'Error' in stdout:
-                        stdout = match.group(1).replace('_x000D__x000A_', '\n')
-                    else:
-                        stdout = ''
-                except:
-                    stdout = ''
-            
-            if stderr and stderr.startswith('#< CLIXML'):
-                # Extract error messages from XML
-                try:
-                    import re
-                    # Extract error messages from XML
-                    error_matches = re.findall(r'<S S="Error">([^<]+)</S>', stderr)
-                    if error_matches:
-                        # Clean up error messages
-                        clean_errors = []
-                        for error in error_matches:
-                            clean_error = error.replace('_x000D__x000A_', '\n').strip()
-                            if clean_error and not clean_error.startswith('At line:') and not clean_error.startswith('+'):
-                                clean_errors.append(clean_error)
-                        stderr = '\n'.join(clean_errors) if clean_errors else ''
-                    else:
-                        # If no error content, clear the XML noise
-                        stderr = ''
-                except:
-                    pass
-
-            # Special handling: If we have output but non-zero return code,
-            # consider it successful for junction detection commands
-            if not success and stdout and "LinkType" in command:
-                success = True
-                self.logger.info(
-                    f"Command executed with warnings but produced output: {stdout}")
-            elif success:
-                self.logger.info(f"Command executed successfully: {stdout}")
+            returncode, stdout, stderr = result
+            stdout = stdout.strip()
+            stderr = stderr.strip()
+            success = returncode == 0
+
+            if success:
+                self.logger.info("Command executed successfully: %s", stdout)
             else:
                 self.logger.error(
-                    f"Command failed with return code {process.returncode}: {stderr}")
+                    "Command failed with return code %s: %s", returncode, stderr)
 
             return success, stdout, stderr
 
         except subprocess.TimeoutExpired:
-            self.logger.error(f"Command timeout after {timeout} seconds")
+            self.logger.error("Command timeout after %s seconds", timeout)
             return False, "", "Command timeout"
 
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"PowerShell command failed: {e}")
+            self.logger.error("PowerShell command failed: %s", e)
             return False, "", f"PowerShell error: {str(e)}"
 
         except Exception as e:
-            self.logger.error(f"Unexpected error executing PowerShell: {e}")
+            self.logger.error("Unexpected error executing PowerShell: %s", e)
             return False, "", f"Unexpected error: {str(e)}"
 
+    def run_script(self, script: str, args: Sequence[str] = (),
+                   timeout: int = 30) -> Tuple[bool, str, str]:
+        """
+        Execute a parameterized PowerShell script block
+
+        Arguments are passed as literal strings rather than spliced into the
+        script text, so paths with spaces, quotes or $ need no escaping.
+
+        Args:
+            script: Script block body, typically starting with a param() block
+            args: Positional arguments bound to the script's parameters
+            timeout: Command timeout in seconds
+
+        Returns:
+            Tuple of (success, stdout, stderr)
+        """
+        quoted_args = ' '.join(_quote_literal(arg) for arg in args)
+        return self.run_command(f"& {{ {script} }} {quoted_args}".rstrip(), timeout)
+
     def test_powershell_available(self) -> bool:
         """Test if PowerShell is available on the system"""
+        if self._is_available:
+            return True
+
         try:
             success, _, _ = self.run_command("Get-Host", timeout=5)
+            # Only remember success, a failure may be a slow cold start
+            if success:
+                self._is_available = True
             return success
         except Exception:
             return False
 
     def check_admin_privileges(self) -> bool:
         """Check if running with administrator privileges"""
+        # Elevation cannot change during the lifetime of the process
+        if self._is_admin is not None:
+            return self._is_admin
+
+        if sys.platform == "win32":
+            try:
+                self._is_admin = bool(_IsUserAnAdmin())
+                return self._is_admin
+            except Exception as e:
+                self.logger.warning("IsUserAnAdmin failed, falling back to PowerShell: %s", e)
+
         try:
-            command = "([Security.Principal.WindowsPrincipal] " \
-                "[Security.Principal.WindowsIdentity]::GetCurrent()).IsInRole(" \
-                "[Security.Principal.WindowsBuiltInRole]::Administrator)"
+            success, stdout, _ = self.run_command(_ADMIN_CHECK_COMMAND, timeout=5)
+            if not success:
+                return False
 
-            success, stdout, _ = self.run_command(command, timeout=5)
-            if success and stdout.lower().strip() == "true":
-                return True
-            return False
+            self._is_admin = stdout.lower().strip() == "true"
+            return self._is_admin
 
         except Exception as e:
-            self.logger.error(f"Failed to check admin privileges: {e}")
+            self.logger.error("Failed to check admin privileges: %s", e)
             return False
 
     def request_admin_privileges(self) -> bool:
@@ -137,11 +330,11 @@ class PowerShellExecutor:
             if sys.platform != "win32":
                 return False
 
-            import ctypes
-            return ctypes.windll.shell32.ShellExecuteW(
-                None, "runas", sys.executable, " ".join(sys.argv), None, 1
-            ) > 32
+            # ShellExecuteW returns a pseudo-HINSTANCE, values above 32 mean success
+            result = _ShellExecuteW(
+                None, "runas", sys.executable, " ".join(sys.argv), None, 1)
+            return (result or 0) > 32
 
         except Exception as e:
-            self.logger.error(f"Failed to request admin privileges: {e}")
+            self.logger.error("Failed to request admin privileges: %s", e)
             return False
@@ -5,20 +5,38 @@ Rollback functionality for OneDrive Custom Backup Tool
 import os
 import shutil
 import logging
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import json
 import tempfile
 
+try:
+    # Optional fast JSON encoder, the standard library is used otherwise
+    import orjson
+except ImportError:
+    orjson = None
+
+from utils.paths import (
+    PathUtils, FILE_ATTRIBUTE_REPARSE_POINT, IO_REPARSE_TAG_MOUNT_POINT)
+
+
+def _is_mount_point(st: os.stat_result) -> bool:
+    """Check an lstat result for a junction (mount point) reparse tag"""
+    return bool(getattr(st, 'st_file_attributes', 0) & FILE_ATTRIBUTE_REPARSE_POINT
+                and getattr(st, 'st_reparse_tag', 0) == IO_REPARSE_TAG_MOUNT_POINT)
+
 
 class RollbackManager:
     """Manages rollback functionality for backup operations"""
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.path_utils = PathUtils()
         self.rollback_data: Optional[Dict[str, Any]] = None
         self.temp_dir = Path(tempfile.gettempdir()) / "OneDriveBackupTool"
         self.temp_dir.mkdir(exist_ok=True)
+        self._rollback_file = self.temp_dir / "rollback.json"
 
     def create_rollback_point(self, source: str, target: str) -> bool:
         """
@@ -33,53 +51,73 @@ class RollbackManager:
         """
         try:
             self.logger.info(
-                f"Creating rollback point for: {source} -> {target}")
+                "Creating rollback point for: %s -> %s", source, target)
 
             source_path = Path(source)
             target_path = Path(target)
 
+            source_exists, source_is_junction, junction_target = self._probe(
+                source_path)
+            target_exists, _, _ = self._probe(target_path)
+
             # Store rollback information
             self.rollback_data = {
                 "source": str(source_path.resolve()),
                 "target": str(target_path.resolve()),
-                "source_existed": source_path.exists(),
-                "target_existed": target_path.exists(),
-                "source_is_junction": self._is_junction(source_path),
+                "source_existed": source_exists,
+                "target_existed": target_exists,
+                "source_is_junction": source_is_junction,
                 "backup_created": False,
                 "junction_created": False,
                 "timestamp": self._get_timestamp()
             }
 
             # If source is a junction, store its target
-            if self.rollback_data["source_is_junction"]:
-                self.rollback_data["original_junction_target"] = self._get_junction_target(
-                    source_path)
+            if source_is_junction:
+                self.rollback_data["original_junction_target"] = junction_target
 
             # Save rollback data to temp file
-            rollback_file = self.temp_dir / "rollback.json"
-            with open(rollback_file, 'w') as f:
-                json.dump(self.rollback_data, f, indent=2)
+            self._save_rollback_data()
 
             self.logger.info("Rollback point created successfully")
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to create rollback point: {e}")
+            self.logger.error("Failed to create rollback point: %s", e)
             return False
 
-    def update_rollback_status(self, backup_created: bool = False, junction_created: bool = False):
-        """Update rollback status during backup process"""
+    def update_rollback_status(self, **updates: bool):
+        """
+        Update rollback status during backup process
+
+        All flags given are applied together and written in a single save,
+        flags that are not given keep their current value.
+
+        Args:
+            **updates: Status flags to set, e.g. backup_created=True
+        """
         if self.rollback_data:
-            self.rollback_data["backup_created"] = backup_created
-            self.rollback_data["junction_created"] = junction_created
+            self.rollback_data.update(updates)
 
-            # Save updated data
-            rollback_file = self.temp_dir / "rollback.json"
             try:
-                with open(rollback_file, 'w') as f:
-                    json.dump(self.rollback_data, f, indent=2)
+                self._save_rollback_data()
             except Exception as e:
-                self.logger.error(f"Failed to update rollback status: {e}")
+                self.logger.error("Failed to update rollback status: %s", e)
+
+    def _save_rollback_data(self):
+        """Write the rollback data to the temp file in one write"""
+        if orjson is not None:
+            data = orjson.dumps(self.rollback_data, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.rollback_data, indent=2).encode('utf-8')
+        self._rollback_file.write_bytes(data)
+
+    def _load_rollback_data(self) -> Dict[str, Any]:
+        """Read the rollback data back from the temp file"""
+        raw = self._rollback_file.read_bytes()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw.decode('utf-8'))
 
     def rollback(self) -> bool:
         """
@@ -89,36 +127,35 @@ class RollbackManager:
             True if rollback successful
         """
         try:
-            if not self.rollback_data:
+            data = self.rollback_data
+            if not data:
                 # Try to load from temp file
-                rollback_file = self.temp_dir / "rollback.json"
-                if rollback_file.exists():
-                    with open(rollback_file, 'r') as f:
-                        self.rollback_data = json.load(f)
+                if os.path.isfile(self._rollback_file):
+                    data = self._load_rollback_data()
+                    self.rollback_data = data
                 else:
                     self.logger.warning("No rollback data available")
                     return False
 
             self.logger.info("Starting rollback operation")
 
-            source_path = Path(self.rollback_data["source"])
-            target_path = Path(self.rollback_data["target"])
+            source_path = Path(data["source"])
+            target_path = Path(data["target"])
 
             success = True
 
             # Step 1: Remove junction if it was created
-            if self.rollback_data.get("junction_created", False):
+            if data.get("junction_created", False):
                 success &= self._remove_junction(source_path)
 
             # Step 2: Move back from target if backup was created
-            if self.rollback_data.get("backup_created", False):
+            if data.get("backup_created", False):
                 success &= self._move_back_from_target(
                     source_path, target_path)
 
             # Step 3: Restore original junction if it existed
-            if self.rollback_data.get("source_is_junction", False):
-                original_target = self.rollback_data.get(
-                    "original_junction_target")
+            if data.get("source_is_junction", False):
+                original_target = data.get("original_junction_target")
                 if original_target:
                     success &= self._restore_junction(
                         source_path, original_target)
@@ -131,43 +168,38 @@ class RollbackManager:
             return success
 
         except Exception as e:
-            self.logger.error(f"Rollback operation failed: {e}")
+            self.logger.error("Rollback operation failed: %s", e)
             return False
 
     def clear_rollback_point(self):
         """Clear rollback point after successful backup"""
         try:
             self.rollback_data = None
-            rollback_file = self.temp_dir / "rollback.json"
-            if rollback_file.exists():
-                rollback_file.unlink()
+            if self._rollback_file.exists():
+                self._rollback_file.unlink()
             self.logger.info("Rollback point cleared")
         except Exception as e:
-            self.logger.error(f"Failed to clear rollback point: {e}")
+            self.logger.error("Failed to clear rollback point: %s", e)
 
     def _remove_junction(self, junction_path: Path) -> bool:
         """Remove junction link"""
         try:
-            if junction_path.exists() and self._is_junction(junction_path):
-                # Use rmdir for junction removal (safer than shutil.rmtree)
-                import subprocess
-                result = subprocess.run(
-                    f'rmdir "{junction_path}"',
-                    shell=True,
-                    capture_output=True,
-                    text=True
-                )
-
-                if result.returncode == 0:
-                    self.logger.info(f"Junction removed: {junction_path}")
-                    return True
-                else:
+            # A missing path has no lstat result, so this also covers exists()
+            if self._lstat_is_junction(junction_path) is not None:
+                # Removing the directory entry drops only the reparse point,
+                # never the target's contents (safer than shutil.rmtree)
+                try:
+                    os.rmdir(str(junction_path))
+                except OSError as e:
                     self.logger.error(
-                        f"Failed to remove junction: {result.stderr}")
+                        "Failed to remove junction (errno %s): %s", e.errno, e)
                     return False
+
+                self.logger.info("Junction removed: %s", junction_path)
+                return True
             return True
         except Exception as e:
-            self.logger.error(f"Error removing junction: {e}")
+            self.logger.error("Error removing junction: %s", e)
             return False
 
     def _move_back_from_target(self, source_path: Path, target_path: Path) -> bool:
@@ -177,56 +209,89 @@ class RollbackManager:
                 # Ensure parent directory exists
                 source_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # Move back using shutil
-                shutil.move(str(target_path), str(source_path))
-                self.logger.info(f"Moved back: {target_path} -> {source_path}")
+                try:
+                    # A plain rename is atomic and constant-time on the same volume
+                    os.replace(str(target_path), str(source_path))
+                except OSError as e:
+                    # Cross-volume or occupied destination, shutil.move copies as needed
+                    self.logger.debug("Rename failed, falling back to shutil.move: %s", e)
+                    shutil.move(str(target_path), str(source_path))
+                self.logger.info("Moved back: %s -> %s", target_path, source_path)
                 return True
             return True
         except Exception as e:
-            self.logger.error(f"Error moving back from target: {e}")
+            self.logger.error("Error moving back from target: %s", e)
             return False
 
     def _restore_junction(self, source_path: Path, target: str) -> bool:
         """Restore original junction"""
         try:
-            import subprocess
-            command = f'mklink /J "{source_path}" "{target}"'
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode == 0:
+            success, error = self.path_utils.create_junction(
+                str(source_path), target)
+
+            if success:
                 self.logger.info(
-                    f"Original junction restored: {source_path} -> {target}")
+                    "Original junction restored: %s -> %s", source_path, target)
                 return True
             else:
                 self.logger.error(
-                    f"Failed to restore junction: {result.stderr}")
+                    "Failed to restore junction: %s", error)
                 return False
         except Exception as e:
-            self.logger.error(f"Error restoring junction: {e}")
+            self.logger.error("Error restoring junction: %s", e)
             return False
 
+    def _lstat_is_junction(self, path: Path) -> Optional[os.stat_result]:
+        """
+        Check if path is a junction point with a single lstat
+
+        Args:
+            path: Path to check
+
+        Returns:
+            The lstat result if path is a junction point, None otherwise
+        """
+        try:
+            st = os.lstat(str(path))
+        except OSError:
+            return None
+
+        return st if _is_mount_point(st) else None
+
+    def _probe(self, path: Path) -> Tuple[bool, bool, Optional[str]]:
+        """
+        Collect existence and junction state of a path from a single lstat
+
+        Args:
+            path: Path to probe
+
+        Returns:
+            Tuple of (exists, is_junction, junction_target)
+        """
+        try:
+            st = os.lstat(str(path))
+        except OSError:
+            return False, False, None
+
+        if not _is_mount_point(st):
+            return True, False, None
+
+        # A junction only counts as existing if its target is reachable
+        return os.path.exists(str(path)), True, self._get_junction_target(path)
+
     def _is_junction(self, path: Path) -> bool:
         """Check if path is a junction point"""
-        try:
-            return path.is_dir() and path.is_symlink()
-        except Exception:
-            return False
+        return self._lstat_is_junction(path) is not None
 
     def _get_junction_target(self, path: Path) -> Optional[str]:
         """Get junction target path"""
         try:
-            if self._is_junction(path):
-                return str(path.readlink())
-            return None
+            # Checks the reparse tag and reads the target from one handle
+            _, target = self.path_utils.get_junction_info_atomic(str(path))
+            return target
         except Exception:
             return None
 
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
@@ -4,9 +4,14 @@ Main GUI window for OneDrive Custom Backup Tool
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import tkinter.font as tkfont
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import sys
 from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
 import logging
 
 from gui.validators import PathValidator
@@ -15,10 +20,123 @@ from core.junction_manager import JunctionManager
 from utils.config import get_config
 from utils.paths import PathUtils
 
+# Minimum time between progress redraws, in seconds
+PROGRESS_INTERVAL = 0.05
+
+# Window icon, checked once when the module is loaded
+ICON_PATH = Path(__file__).parent.parent.parent / "assets" / "icon.ico"
+ICON_EXISTS = ICON_PATH.is_file()
+
+# Fixed main window size, in pixels
+WINDOW_SIZE = (650, 450)
+
+# Pause in typing before a path is validated, in milliseconds
+VALIDATION_DELAY_MS = 200
+
+# Junction list row: index, source and target
+_format_junction_row = "{:2d}. {} → {}".format
+
+_ABOUT_TEXT = """OneDrive Custom Backup Folder Tool
+
+A modern Windows GUI application that creates OneDrive backups using junction links.
+
+Version: 1.0.0
+Author: GitHub Community
+License: MIT
+
+Features:
+• Simple, clean GUI interface
+• Safe backup operations with rollback
+• PowerShell integration for junction links
+• Real-time path validation
+• Junction link management
+• Windows 10/11 optimized
+
+Visit: https://github.com/newfebriwisnu/OneDrive-Custom-Backup-Tool"""
+
+_HOW_TO_TEXT = """How to Use OneDrive Custom Backup Tool
+
+STEP 1: SELECT SOURCE FOLDER
+• Click "Browse" next to "Source Folder"
+• Choose the folder you want to backup to OneDrive
+• This folder will be moved to OneDrive
+
+STEP 2: SELECT TARGET FOLDER
+• Click "Browse" next to "Target OneDrive Folder"
+• Choose where in OneDrive you want to store the backup
+• Usually in your OneDrive folder (e.g., OneDrive/Backup)
+
+STEP 3: EXECUTE BACKUP
+• Click "Execute Backup" to start the process
+• The tool will:
+  1. Move your folder to OneDrive
+  2. Create a junction link at the original location
+  3. Your applications will continue working normally
+
+JUNCTION MANAGEMENT:
+• Use "List Junctions" to see all existing junction links
+• Remove unwanted junctions safely
+• Verify junctions are working correctly
+
+IMPORTANT NOTES:
+• Always backup important data before using junction links
+• Ensure OneDrive is syncing properly
+• Junction links only work on the same drive
+• Administrator rights may be required for some operations
+
+WHAT IS A JUNCTION LINK?
+A junction link is like a shortcut that makes a folder appear in two places at once. 
+Your applications see the folder in its original location, but the actual files are 
+stored in OneDrive and synced to the cloud.
+
+TROUBLESHOOTING:
+• If backup fails, check that OneDrive is running
+• Ensure you have write permissions to both locations
+• Try running as administrator if permission errors occur
+• Check Windows Event Viewer for detailed error messages"""
+
 
 class MainWindow:
     """Main application window"""
 
+    # Shared widget options. Fonts are referenced by name so Tk resolves
+    # each one once, see _setup_fonts.
+    #
+    # Button colors as (background, foreground, active background), applied
+    # once as ttk styles in _setup_styles
+    _BUTTON_STYLES = {
+        'Secondary.TButton': ('#404040', '#00ffff', '#505050'),
+        'Help.TButton': ('#404040', '#ffff00', '#505050'),
+        'Plain.TButton': ('#404040', '#ffffff', '#505050'),
+        'Primary.TButton': ('#0078d4', '#ffffff', '#106ebe'),
+        'Danger.TButton': ('#d83b01', '#ffffff', '#b22a00'),
+        'Success.TButton': ('#107c10', '#ffffff', '#0e6b0e'),
+    }
+    _ENTRY_STYLE = {
+        'font': 'AppEntryFont',
+        'width': 50,
+        'bg': '#404040',
+        'fg': '#ffffff',
+        'insertbackground': '#00ffff',
+        'relief': 'flat',
+        'bd': 2
+    }
+    _SECTION_LABEL_STYLE = {
+        'font': 'AppSectionFont',
+        'bg': '#2b2b2b',
+        'fg': '#ffffff'
+    }
+
+    # Status text shown for each backup progress message
+    _CYBER_MESSAGES = MappingProxyType({
+        "Validating paths...": "SCANNING TARGET COORDINATES...",
+        "Preparing rollback...": "PREPARING RECOVERY PROTOCOL...",
+        "Moving files to OneDrive...": "INITIATING DATA TRANSFER...",
+        "Creating junction link...": "ESTABLISHING QUANTUM LINK...",
+        "Verifying backup...": "VERIFYING SYSTEM INTEGRITY...",
+        "Backup completed successfully!": "MISSION ACCOMPLISHED!"
+    })
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.config = get_config()
@@ -30,6 +148,8 @@ class MainWindow:
         # Initialize GUI
         self.root = tk.Tk()
         self.root.configure(bg='#2b2b2b')  # Dark background
+        self._setup_fonts()
+        self._setup_styles()
 
         # Variables
         self.source_var = tk.StringVar()
@@ -47,35 +167,99 @@ class MainWindow:
         # State
         self.is_executing = False
 
+        # Set to stop the running backup before its next step
+        self._cancel_event = None
+        # Exit requested during a backup, honoured once the worker finishes
+        self._exit_pending = False
+
+        # Progress from the worker thread is coalesced into one pending update
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
+        self._progress_scheduled = False
+        self._last_progress_ts = 0.0
+
+        # Background work for the junction window, one scan is tracked at a time
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._pending_junction_future = None
+
+        # Backups get their own worker so a running scan never delays one
+        self._backup_executor = ThreadPoolExecutor(max_workers=1)
+
+        # Set once the window is destroyed, workers must not call into Tk then
+        self._closed = False
+
+        # Pending debounced validations
+        self._source_validate_job = None
+        self._target_validate_job = None
+
+        # How To window, built on first open and hidden when closed
+        self._how_to_window = None
+
+        # OneDrive location, looked up until it is found
+        self._onedrive_path_cache = None
+
         self._setup_window()
         self._create_widgets()
         self._setup_events()
         self._load_saved_paths()
 
+        # Off the first-paint path, so startup is not delayed
+        self.root.after(50, self._prewarm_dialogs)
+
         self.logger.info("Main window initialized")
 
+    def _setup_fonts(self):
+        """Create the named fonts used by the shared widget styles"""
+        # Keep references, Tk deletes a named font when its Font object is collected
+        self._fonts = [
+            tkfont.Font(root=self.root, name='AppButtonFont',
+                        family='Segoe UI', size=9),
+            tkfont.Font(root=self.root, name='AppEntryFont',
+                        family='Segoe UI', size=10),
+            tkfont.Font(root=self.root, name='AppSectionFont',
+                        family='Segoe UI', size=10, weight='bold'),
+            tkfont.Font(root=self.root, name='AppExecuteFont',
+                        family='Segoe UI', size=12, weight='bold'),
+        ]
+
+    def _setup_styles(self):
+        """Configure the ttk button styles once for every window"""
+        style = ttk.Style(self.root)
+        # Native themes ignore custom button colors, clam honours them
+        style.theme_use('clam')
+
+        for name, (bg, fg, active_bg) in self._BUTTON_STYLES.items():
+            style.configure(name, font='AppButtonFont', background=bg,
+                            foreground=fg, relief='flat', borderwidth=1)
+            style.map(name, background=[('active', active_bg)],
+                      foreground=[('active', '#ffffff')])
+
+        # Variants inherit colors from the style after the first dot
+        style.configure('Execute.Primary.TButton', font='AppExecuteFont',
+                        borderwidth=2, padding=(6, 8))
+        style.configure('Dialog.Plain.TButton', font='AppEntryFont')
+
     def _setup_window(self):
         """Setup main window properties"""
         self.root.title("OneDrive Custom Backup Tool")
-        self.root.geometry("650x450")  # Increased height for new features
+        width, height = WINDOW_SIZE  # Increased height for new features
         self.root.resizable(False, False)
 
-        # Center window on screen
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
+        # The window size is fixed, so packing widgets into it never needs
+        # to propagate size requests back up to the toplevel
+        self.root.pack_propagate(False)
+
+        # Center window on screen, the size is known so no layout pass is forced
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
 
         # Set window icon (if available)
-        try:
-            icon_path = Path(__file__).parent.parent.parent / \
-                "assets" / "icon.ico"
-            if icon_path.exists():
-                self.root.iconbitmap(str(icon_path))
-        except Exception:
-            pass
+        if ICON_EXISTS:
+            try:
+                self.root.iconbitmap(str(ICON_PATH))
+            except Exception:
+                pass
 
     def _create_widgets(self):
         """Create main window widgets with simple, compact design"""
@@ -93,104 +277,21 @@ class MainWindow:
         )
         title_label.pack(pady=(0, 20))
 
-        # Source path section
-        source_label = tk.Label(
-            main_frame,
-            text="Source Folder:",
-            font=('Segoe UI', 10, 'bold'),
-            bg='#2b2b2b',
-            fg='#ffffff'
-        )
-        source_label.pack(anchor=tk.W, pady=(0, 5))
-
-        source_frame = tk.Frame(main_frame, bg='#2b2b2b')
-        source_frame.pack(fill=tk.X, pady=(0, 15))
-
-        self.source_entry = tk.Entry(
-            source_frame,
-            textvariable=self.source_var,
-            font=('Segoe UI', 10),
-            width=50,
-            bg='#404040',
-            fg='#ffffff',
-            insertbackground='#00ffff',
-            relief='flat',
-            bd=2
-        )
-        self.source_entry.pack(side=tk.LEFT, fill=tk.X,
-                               expand=True, padx=(0, 10))
-
-        source_browse_btn = tk.Button(
-            source_frame,
-            text="Browse",
-            command=self._browse_source,
-            font=('Segoe UI', 9),
-            bg='#404040',
-            fg='#00ffff',
-            activebackground='#505050',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=1,
-            width=8
-        )
-        source_browse_btn.pack(side=tk.RIGHT)
-
-        # Target path section
-        target_label = tk.Label(
-            main_frame,
-            text="Target OneDrive Folder:",
-            font=('Segoe UI', 10, 'bold'),
-            bg='#2b2b2b',
-            fg='#ffffff'
-        )
-        target_label.pack(anchor=tk.W, pady=(0, 5))
-
-        target_frame = tk.Frame(main_frame, bg='#2b2b2b')
-        target_frame.pack(fill=tk.X, pady=(0, 20))
-
-        self.target_entry = tk.Entry(
-            target_frame,
-            textvariable=self.target_var,
-            font=('Segoe UI', 10),
-            width=50,
-            bg='#404040',
-            fg='#ffffff',
-            insertbackground='#00ffff',
-            relief='flat',
-            bd=2
-        )
-        self.target_entry.pack(side=tk.LEFT, fill=tk.X,
-                               expand=True, padx=(0, 10))
-
-        target_browse_btn = tk.Button(
-            target_frame,
-            text="Browse",
-            command=self._browse_target,
-            font=('Segoe UI', 9),
-            bg='#404040',
-            fg='#00ffff',
-            activebackground='#505050',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=1,
-            width=8
-        )
-        target_browse_btn.pack(side=tk.RIGHT)
+        # Source and target path sections
+        self.source_entry = self._build_path_row(
+            main_frame, "Source Folder:", self.source_var,
+            self._browse_source, pady=(0, 15))
+        self.target_entry = self._build_path_row(
+            main_frame, "Target OneDrive Folder:", self.target_var,
+            self._browse_target, pady=(0, 20))
 
         # Execute button
-        self.execute_button = tk.Button(
+        self.execute_button = ttk.Button(
             main_frame,
             text="Execute Backup",
             command=self._execute_backup,
-            font=('Segoe UI', 12, 'bold'),
-            bg='#0078d4',
-            fg='#ffffff',
-            activebackground='#106ebe',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=2,
             width=20,
-            pady=8
+            style='Execute.Primary.TButton'
         )
         self.execute_button.pack(pady=(0, 15))
 
@@ -221,9 +322,7 @@ class MainWindow:
         junction_label = tk.Label(
             junction_frame,
             text="Junction Links Management:",
-            font=('Segoe UI', 10, 'bold'),
-            bg='#2b2b2b',
-            fg='#ffffff'
+            **self._SECTION_LABEL_STYLE
         )
         junction_label.pack(anchor=tk.W, pady=(0, 5))
 
@@ -231,33 +330,21 @@ class MainWindow:
         junction_buttons_frame = tk.Frame(junction_frame, bg='#2b2b2b')
         junction_buttons_frame.pack(fill=tk.X, pady=(0, 5))
 
-        list_junctions_btn = tk.Button(
+        list_junctions_btn = ttk.Button(
             junction_buttons_frame,
             text="List Junctions",
             command=self._show_junction_list,
-            font=('Segoe UI', 9),
-            bg='#404040',
-            fg='#00ffff',
-            activebackground='#505050',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=1,
-            width=12
+            width=12,
+            style='Secondary.TButton'
         )
         list_junctions_btn.pack(side=tk.LEFT, padx=(0, 10))
 
-        refresh_btn = tk.Button(
+        refresh_btn = ttk.Button(
             junction_buttons_frame,
             text="Refresh",
             command=self._refresh_junction_list,
-            font=('Segoe UI', 9),
-            bg='#404040',
-            fg='#00ffff',
-            activebackground='#505050',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=1,
-            width=8
+            width=8,
+            style='Secondary.TButton'
         )
         refresh_btn.pack(side=tk.LEFT)
 
@@ -268,18 +355,12 @@ class MainWindow:
         how_to_frame = tk.Frame(main_frame, bg='#2b2b2b')
         how_to_frame.pack(fill=tk.X, pady=(0, 15))
 
-        how_to_btn = tk.Button(
+        how_to_btn = ttk.Button(
             how_to_frame,
             text="How To Use",
             command=self._show_how_to,
-            font=('Segoe UI', 9),
-            bg='#404040',
-            fg='#ffff00',
-            activebackground='#505050',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=1,
-            width=12
+            width=12,
+            style='Help.TButton'
         )
         how_to_btn.pack(anchor=tk.W)
 
@@ -287,46 +368,68 @@ class MainWindow:
         bottom_frame = tk.Frame(main_frame, bg='#2b2b2b')
         bottom_frame.pack(fill=tk.X)
 
-        about_btn = tk.Button(
+        about_btn = ttk.Button(
             bottom_frame,
             text="About",
             command=self._show_about,
-            font=('Segoe UI', 9),
-            bg='#404040',
-            fg='#ffffff',
-            activebackground='#505050',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=1,
-            width=10
+            width=10,
+            style='Plain.TButton'
         )
         about_btn.pack(side=tk.LEFT, padx=(0, 10))
 
-        exit_btn = tk.Button(
+        exit_btn = ttk.Button(
             bottom_frame,
             text="Exit",
             command=self._exit_application,
-            font=('Segoe UI', 9),
-            bg='#404040',
-            fg='#ffffff',
-            activebackground='#505050',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=1,
-            width=10
+            width=10,
+            style='Plain.TButton'
         )
         exit_btn.pack(side=tk.LEFT)
 
         # Set initial status
         self.status_var.set("Ready - Select source and target folders")
 
+    def _build_path_row(self, parent, label_text: str, var: tk.StringVar,
+                        browse_cmd, pady) -> tk.Entry:
+        """
+        Build a labelled path entry with a Browse button
+
+        Args:
+            parent: Container to pack the row into
+            label_text: Section label above the entry
+            var: Variable bound to the entry
+            browse_cmd: Command for the Browse button
+            pady: Vertical padding below the row
+
+        Returns:
+            The path entry widget
+        """
+        label = tk.Label(parent, text=label_text, **self._SECTION_LABEL_STYLE)
+        label.pack(anchor=tk.W, pady=(0, 5))
+
+        frame = tk.Frame(parent, bg='#2b2b2b')
+        frame.pack(fill=tk.X, pady=pady)
+
+        entry = tk.Entry(frame, textvariable=var, **self._ENTRY_STYLE)
+        entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+
+        browse_btn = ttk.Button(
+            frame,
+            text="Browse",
+            command=browse_cmd,
+            width=8,
+            style='Secondary.TButton'
+        )
+        browse_btn.pack(side=tk.RIGHT)
+
+        return entry
+
     def _setup_events(self):
         """Setup event bindings"""
-        # Path validation on key release
-        self.source_entry.bind(
-            '<KeyRelease>', lambda e: self._validate_source())
-        self.target_entry.bind(
-            '<KeyRelease>', lambda e: self._validate_target())
+        # Path validation on any change (typing, browsing, suggestions),
+        # debounced while typing
+        self.source_var.trace_add('write', self._debounced_validate_source)
+        self.target_var.trace_add('write', self._debounced_validate_target)
 
         # Window close event
         self.root.protocol("WM_DELETE_WINDOW", self._exit_application)
@@ -334,25 +437,33 @@ class MainWindow:
         # Auto-suggest OneDrive path
         self.target_entry.bind('<FocusIn>', self._suggest_onedrive_path)
 
-        # Entry focus styling
-        self.source_entry.bind(
-            '<FocusIn>', lambda e: self._on_entry_focus(self.source_entry))
-        self.source_entry.bind(
-            '<FocusOut>', lambda e: self._on_entry_blur(self.source_entry))
-        self.target_entry.bind(
-            '<FocusIn>', lambda e: self._on_entry_focus(self.target_entry))
-        self.target_entry.bind(
-            '<FocusOut>', lambda e: self._on_entry_blur(self.target_entry))
-
-    def _on_entry_focus(self, entry):
+        # Entry focus styling, added alongside the OneDrive suggestion
+        for entry in (self.source_entry, self.target_entry):
+            entry.bind('<FocusIn>', self._on_entry_focus, add='+')
+            entry.bind('<FocusOut>', self._on_entry_blur, add='+')
+
+    def _on_entry_focus(self, event):
         """Handle entry focus styling"""
-        entry.config(bg='#505050', highlightbackground='#00ffff',
-                     highlightcolor='#00ffff')
+        event.widget.config(bg='#505050', highlightbackground='#00ffff',
+                            highlightcolor='#00ffff')
 
-    def _on_entry_blur(self, entry):
+    def _on_entry_blur(self, event):
         """Handle entry blur styling"""
-        entry.config(bg='#404040', highlightbackground='#404040',
-                     highlightcolor='#404040')
+        event.widget.config(bg='#404040', highlightbackground='#404040',
+                            highlightcolor='#404040')
+
+    def _prewarm_dialogs(self):
+        """Load the Tcl dialog scripts ahead of the first Browse or message box"""
+        # Windows dialogs are native, elsewhere they are Tcl procs that Tk
+        # sources from its library on first use
+        if sys.platform == "win32":
+            return
+
+        for command in ('::tk::dialog::file::chooseDir::', '::tk::MessageBox'):
+            try:
+                self.root.tk.call('auto_load', command)
+            except tk.TclError:
+                pass
 
     def _load_saved_paths(self):
         """Load saved paths from configuration"""
@@ -365,67 +476,118 @@ class MainWindow:
             if last_target:
                 self.target_var.set(last_target)
 
+    def _ask_directory_async(self, title: str, initialdir: str, callback):
+        """
+        Show a folder dialog once pending redraws are done
+
+        Tk dialogs must run on the main thread, so the dialog is deferred to
+        the next idle pass instead of being moved to a worker. The button
+        handler returns at once and queued progress updates are painted first.
+
+        Args:
+            title: Dialog title
+            initialdir: Directory the dialog opens in
+            callback: Called with the selected folder, or '' if cancelled
+        """
+        def ask():
+            try:
+                folder = filedialog.askdirectory(
+                    title=title, initialdir=initialdir)
+                callback(folder)
+            except Exception as e:
+                self.logger.error(f"Error browsing for folder: {e}")
+
+        self.root.after_idle(ask)
+
     def _browse_source(self):
         """Browse for source folder"""
         try:
             initial_dir = self.source_var.get() or str(Path.home())
-            folder = filedialog.askdirectory(
-                title="Select Source Folder",
-                initialdir=initial_dir
-            )
-
-            if folder:
-                self.source_var.set(folder)
-                self._validate_source()
+            self._ask_directory_async(
+                "Select Source Folder", initial_dir, self._on_source_selected)
         except Exception as e:
             self.logger.error(f"Error browsing source: {e}")
 
+    def _on_source_selected(self, folder: str):
+        """Apply a folder picked in the source dialog"""
+        if folder:
+            self.source_var.set(folder)
+
     def _browse_target(self):
         """Browse for target folder"""
         try:
             # Auto-suggest OneDrive path
             initial_dir = self.target_var.get()
             if not initial_dir:
-                onedrive_path = self.path_utils.get_onedrive_path()
+                onedrive_path = self._get_onedrive_path_cached()
                 if onedrive_path:
                     initial_dir = onedrive_path
                 else:
                     initial_dir = str(Path.home())
 
-            folder = filedialog.askdirectory(
-                title="Select Target Folder (OneDrive)",
-                initialdir=initial_dir
-            )
-
-            if folder:
-                self.target_var.set(folder)
-                self._validate_target()
+            self._ask_directory_async(
+                "Select Target Folder (OneDrive)", initial_dir, self._on_target_selected)
         except Exception as e:
             self.logger.error(f"Error browsing target: {e}")
 
+    def _on_target_selected(self, folder: str):
+        """Apply a folder picked in the target dialog"""
+        if folder:
+            self.target_var.set(folder)
+
+    def _debounced_validate_source(self, *args):
+        """Validate source once typing pauses"""
+        if self._source_validate_job is not None:
+            self.root.after_cancel(self._source_validate_job)
+        self._source_validate_job = self.root.after(
+            VALIDATION_DELAY_MS, self._run_source_validation)
+
+    def _debounced_validate_target(self, *args):
+        """Validate target once typing pauses"""
+        if self._target_validate_job is not None:
+            self.root.after_cancel(self._target_validate_job)
+        self._target_validate_job = self.root.after(
+            VALIDATION_DELAY_MS, self._run_target_validation)
+
+    def _run_source_validation(self):
+        """Run a debounced source validation"""
+        self._source_validate_job = None
+        self._validate_source()
+
+    def _run_target_validation(self):
+        """Run a debounced target validation"""
+        self._target_validate_job = None
+        self._validate_target()
+
     def _validate_source(self):
         """Validate source path"""
         path = self.source_var.get()
         if path:
-            is_valid = self.path_validator.validate_source_realtime(
+            # The validator's own TTL cache absorbs repeated checks
+            return self.path_validator.validate_source_realtime(
                 self.source_entry, path)
-            return is_valid
         return False
 
     def _validate_target(self):
         """Validate target path"""
         path = self.target_var.get()
         if path:
-            is_valid = self.path_validator.validate_target_realtime(
+            # The validator's own TTL cache absorbs repeated checks
+            return self.path_validator.validate_target_realtime(
                 self.target_entry, path)
-            return is_valid
         return False
 
+    def _get_onedrive_path_cached(self):
+        """Get the OneDrive path, resolving it until it is found"""
+        if self._onedrive_path_cache is None:
+            self._onedrive_path_cache = self.path_utils.get_onedrive_path()
+        return self._onedrive_path_cache
+
     def _suggest_onedrive_path(self, event=None):
         """Auto-suggest OneDrive path"""
         try:
             if not self.target_var.get():
-                onedrive_path = self.path_utils.get_onedrive_path()
+                onedrive_path = self._get_onedrive_path_cached()
                 if onedrive_path:
                     backup_path = Path(onedrive_path) / "Backup"
                     self.target_var.set(str(backup_path))
@@ -433,8 +595,9 @@ class MainWindow:
             self.logger.error(f"Error suggesting OneDrive path: {e}")
 
     def _execute_backup(self):
-        """Execute backup operation"""
+        """Execute backup operation, or cancel the one in progress"""
         if self.is_executing:
+            self._cancel_backup()
             return
 
         try:
@@ -475,33 +638,39 @@ class MainWindow:
                 self.config.set_last_target(target)
                 self.config.save_config()
 
-            # Start backup in separate thread
+            # Run the backup on its own executor, the button now cancels it
             self.is_executing = True
-            self.execute_button.config(state='disabled', text="EXECUTING...")
+            self._cancel_event = threading.Event()
+            self.execute_button.config(text="CANCEL BACKUP")
             self.progress_var.set(0)
             self.status_var.set("INITIALIZING BACKUP SEQUENCE...")
 
-            backup_thread = threading.Thread(
-                target=self._backup_worker,
-                args=(source, target),
-                daemon=True
-            )
-            backup_thread.start()
+            self._backup_executor.submit(
+                self._backup_worker, source, target, self._cancel_event)
 
         except Exception as e:
             self.logger.error(f"Error executing backup: {e}")
             messagebox.showerror(
                 "Error", f"Failed to execute backup: {str(e)}")
 
-    def _backup_worker(self, source: str, target: str):
-        """Backup worker thread"""
+    def _cancel_backup(self):
+        """Ask the running backup to stop and roll back before its next step"""
+        if self._cancel_event is None or self._cancel_event.is_set():
+            return
+        self._cancel_event.set()
+        self.execute_button.config(state='disabled', text="CANCELLING...")
+
+    def _backup_worker(self, source: str, target: str, cancel_event: threading.Event):
+        """Backup worker, runs on the backup executor"""
         try:
             success = self.backup_manager.execute_backup(
-                source, target, self._progress_callback
+                source, target, self._progress_callback,
+                cancel_event=cancel_event
             )
 
             # Update UI on main thread
-            self.root.after(0, self._backup_completed, success)
+            self.root.after(0, self._backup_completed, success, None,
+                            self.backup_manager.last_rollback)
 
         except Exception as e:
             self.logger.error(f"Backup worker error: {e}")
@@ -510,33 +679,84 @@ class MainWindow:
     def _progress_callback(self, message: str, progress: int):
         """Progress callback from backup operation"""
         # Make messages more cyberpunk-style
-        cyber_messages = {
-            "Validating paths...": "SCANNING TARGET COORDINATES...",
-            "Preparing rollback...": "PREPARING RECOVERY PROTOCOL...",
-            "Moving files to OneDrive...": "INITIATING DATA TRANSFER...",
-            "Creating junction link...": "ESTABLISHING QUANTUM LINK...",
-            "Verifying backup...": "VERIFYING SYSTEM INTEGRITY...",
-            "Backup completed successfully!": "MISSION ACCOMPLISHED!"
-        }
-
-        cyber_message = cyber_messages.get(message, message.upper())
-        self.root.after(0, self._update_progress, cyber_message, progress)
+        cyber_message = self._CYBER_MESSAGES.get(message)
+        if cyber_message is None:
+            cyber_message = message.upper()
+
+        with self._progress_lock:
+            # Keep only the latest update, one flush is scheduled at a time
+            self._pending_progress = (cyber_message, progress)
+            if self._progress_scheduled:
+                return
+            self._progress_scheduled = True
+
+            # Start and finish go out at once, other updates at most every 50 ms
+            if progress in (0, 100):
+                delay = 0
+            else:
+                elapsed = time.monotonic() - self._last_progress_ts
+                delay = max(0, int((PROGRESS_INTERVAL - elapsed) * 1000))
+
+        self.root.after(delay, self._flush_progress)
+
+    def _flush_progress(self):
+        """Apply the latest pending progress update on the main thread"""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+            self._progress_scheduled = False
+            self._last_progress_ts = time.monotonic()
+
+        if pending:
+            self._update_progress(*pending)
 
     def _update_progress(self, message: str, progress: int):
         """Update progress on main thread"""
         self.status_var.set(message)
         self.progress_var.set(progress)
-        self.root.update_idletasks()
 
-    def _backup_completed(self, success: bool, error_msg: str = None):
-        """Handle backup completion"""
+    def _backup_completed(self, success: bool, error_msg: str = None,
+                          rolled_back: Optional[bool] = None):
+        """
+        Handle backup completion
+
+        Args:
+            success: Whether the backup completed
+            error_msg: Optional error to show on failure
+            rolled_back: Outcome of the rollback, None if none was needed
+        """
         self.is_executing = False
+        cancelled = self._cancel_event is not None and self._cancel_event.is_set()
+        self._cancel_event = None
+
+        # Drop any progress still queued so it cannot overwrite the final status
+        with self._progress_lock:
+            self._pending_progress = None
+
+        if self._exit_pending:
+            # The worker is done with the window, finish the deferred exit
+            self._exit_application()
+            return
+
         self.execute_button.config(state='normal', text="EXECUTE BACKUP")
 
         if success:
             self.status_var.set("BACKUP SEQUENCE COMPLETED SUCCESSFULLY!")
             self.progress_var.set(100)
             messagebox.showinfo("Success", "Backup completed successfully!")
+        elif cancelled:
+            self.status_var.set("BACKUP SEQUENCE CANCELLED")
+            self.progress_var.set(0)
+            if rolled_back is None:
+                messagebox.showinfo(
+                    "Cancelled", "Backup was cancelled before any changes were made.")
+            elif rolled_back:
+                messagebox.showinfo(
+                    "Cancelled", "Backup was cancelled and the folder was moved back.")
+            else:
+                messagebox.showerror(
+                    "Cancelled", "Backup was cancelled but rolling back failed.\n\n"
+                    "Check the log file before retrying.")
         else:
             self.status_var.set("BACKUP SEQUENCE FAILED!")
             self.progress_var.set(0)
@@ -547,34 +767,28 @@ class MainWindow:
 
     def _show_about(self):
         """Show about dialog"""
-        about_text = """OneDrive Custom Backup Folder Tool
-
-A modern Windows GUI application that creates OneDrive backups using junction links.
-
-Version: 1.0.0
-Author: GitHub Community
-License: MIT
-
-Features:
-• Simple, clean GUI interface
-• Safe backup operations with rollback
-• PowerShell integration for junction links
-• Real-time path validation
-• Junction link management
-• Windows 10/11 optimized
-
-Visit: https://github.com/newfebriwisnu/OneDrive-Custom-Backup-Tool"""
-
-        messagebox.showinfo("About", about_text)
+        messagebox.showinfo("About", _ABOUT_TEXT)
 
     def _exit_application(self):
         """Exit application"""
         try:
             if self.is_executing:
-                if not messagebox.askyesno("Exit", "Backup operation is in progress. Are you sure you want to exit?"):
+                if self._exit_pending:
+                    return
+                if not messagebox.askyesno("Exit", "Backup operation is in progress.\n\n"
+                                           "Cancel it and exit once any changes are rolled back?"):
                     return
+                # The worker still needs the window to report back, so the
+                # exit happens in _backup_completed once it has stopped
+                self._exit_pending = True
+                self._cancel_backup()
+                self.status_var.set("CANCELLING BACKUP, EXITING WHEN DONE...")
+                return
 
             self.logger.info("Application exiting")
+            self._closed = True
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._backup_executor.shutdown(wait=False, cancel_futures=True)
             self.root.quit()
             self.root.destroy()
         except Exception as e:
@@ -598,6 +812,9 @@ Visit: https://github.com/newfebriwisnu/OneDrive-Custom-Backup-Tool"""
         self.junction_window.geometry("800x500")
         self.junction_window.configure(bg='#2b2b2b')
 
+        self.junction_window.protocol(
+            "WM_DELETE_WINDOW", self._close_junction_window)
+
         # Center window
         self.junction_window.transient(self.root)
         self.junction_window.grab_set()
@@ -621,18 +838,12 @@ Visit: https://github.com/newfebriwisnu/OneDrive-Custom-Backup-Tool"""
         buttons_frame = tk.Frame(main_frame, bg='#2b2b2b')
         buttons_frame.pack(fill=tk.X, pady=(0, 15))
 
-        refresh_btn = tk.Button(
+        refresh_btn = ttk.Button(
             buttons_frame,
             text="Refresh List",
             command=self._update_junction_list,
-            font=('Segoe UI', 9),
-            bg='#0078d4',
-            fg='#ffffff',
-            activebackground='#106ebe',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=1,
-            width=12
+            width=12,
+            style='Primary.TButton'
         )
         refresh_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -663,48 +874,30 @@ Visit: https://github.com/newfebriwisnu/OneDrive-Custom-Backup-Tool"""
         action_frame = tk.Frame(main_frame, bg='#2b2b2b')
         action_frame.pack(fill=tk.X, pady=(15, 0))
 
-        remove_btn = tk.Button(
+        remove_btn = ttk.Button(
             action_frame,
             text="Remove Selected",
             command=self._remove_selected_junction,
-            font=('Segoe UI', 9),
-            bg='#d83b01',
-            fg='#ffffff',
-            activebackground='#b22a00',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=1,
-            width=15
+            width=15,
+            style='Danger.TButton'
         )
         remove_btn.pack(side=tk.LEFT, padx=(0, 10))
 
-        verify_btn = tk.Button(
+        verify_btn = ttk.Button(
             action_frame,
             text="Verify Selected",
             command=self._verify_selected_junction,
-            font=('Segoe UI', 9),
-            bg='#107c10',
-            fg='#ffffff',
-            activebackground='#0e6b0e',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=1,
-            width=15
+            width=15,
+            style='Success.TButton'
         )
         verify_btn.pack(side=tk.LEFT, padx=(0, 10))
 
-        close_btn = tk.Button(
+        close_btn = ttk.Button(
             action_frame,
             text="Close",
-            command=self.junction_window.destroy,
-            font=('Segoe UI', 9),
-            bg='#404040',
-            fg='#ffffff',
-            activebackground='#505050',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=1,
-            width=10
+            command=self._close_junction_window,
+            width=10,
+            style='Plain.TButton'
         )
         close_btn.pack(side=tk.RIGHT)
 
@@ -715,25 +908,55 @@ Visit: https://github.com/newfebriwisnu/OneDrive-Custom-Backup-Tool"""
         """Update junction list display"""
         try:
             self.junction_listbox.delete(0, tk.END)
+            # Tk draws the placeholder on its next idle pass, no forced redraw
             self.junction_listbox.insert(0, "Loading junction links...")
-            self.junction_window.update_idletasks()
 
-            # Get junction list in a separate thread to avoid blocking UI
-            def load_junctions():
-                try:
-                    junctions = self.junction_manager.list_junctions()
-                    self.root.after(0, self._populate_junction_list, junctions)
-                except Exception as e:
-                    self.root.after(0, self._junction_load_error, str(e))
+            # A refresh supersedes any scan that has not started yet
+            if self._pending_junction_future is not None:
+                self._pending_junction_future.cancel()
 
-            import threading
-            threading.Thread(target=load_junctions, daemon=True).start()
+            # Get junction list on the executor to avoid blocking UI
+            future = self._executor.submit(self.junction_manager.list_junctions)
+            self._pending_junction_future = future
+            future.add_done_callback(self._on_junctions_loaded)
 
         except Exception as e:
             self.logger.error(f"Error updating junction list: {e}")
             messagebox.showerror(
                 "Error", f"Failed to update junction list: {str(e)}")
 
+    def _on_junctions_loaded(self, future):
+        """Hand a finished junction scan back to the main thread"""
+        if future.cancelled() or self._closed:
+            return
+        try:
+            self.root.after(0, self._show_loaded_junctions, future)
+        except (RuntimeError, tk.TclError):
+            # The window was destroyed while the scan was finishing
+            pass
+
+    def _show_loaded_junctions(self, future):
+        """Display a junction scan unless it was superseded or its window closed"""
+        if future is not self._pending_junction_future:
+            return
+        self._pending_junction_future = None
+
+        if not self.junction_window.winfo_exists():
+            return
+
+        error = future.exception()
+        if error is not None:
+            self._junction_load_error(str(error))
+        else:
+            self._populate_junction_list(future.result())
+
+    def _close_junction_window(self):
+        """Close the junction window and drop any scan still pending for it"""
+        if self._pending_junction_future is not None:
+            self._pending_junction_future.cancel()
+            self._pending_junction_future = None
+        self.junction_window.destroy()
+
     def _populate_junction_list(self, junctions):
         """Populate junction list with data"""
         try:
@@ -745,13 +968,13 @@ Visit: https://github.com/newfebriwisnu/OneDrive-Custom-Backup-Tool"""
 
             self.junction_data = junctions  # Store for later use
 
-            for i, junction in enumerate(junctions):
-                source = junction.get('source', '')
-                target = junction.get('target', '')
+            # Format display text
+            items = [_format_junction_row(i, junction.get('source', ''),
+                                          junction.get('target', ''))
+                     for i, junction in enumerate(junctions, 1)]
 
-                # Format display text
-                display_text = f"{i+1:2d}. {source} → {target}"
-                self.junction_listbox.insert(tk.END, display_text)
+            # One Tcl call for the whole list instead of one per junction
+            self.junction_listbox.insert(tk.END, *items)
 
         except Exception as e:
             self.logger.error(f"Error populating junction list: {e}")
@@ -836,46 +1059,12 @@ Visit: https://github.com/newfebriwisnu/OneDrive-Custom-Backup-Tool"""
 
     def _show_how_to(self):
         """Show how to use guide"""
-        how_to_text = """How to Use OneDrive Custom Backup Tool
-
-STEP 1: SELECT SOURCE FOLDER
-• Click "Browse" next to "Source Folder"
-• Choose the folder you want to backup to OneDrive
-• This folder will be moved to OneDrive
-
-STEP 2: SELECT TARGET FOLDER
-• Click "Browse" next to "Target OneDrive Folder"
-• Choose where in OneDrive you want to store the backup
-• Usually in your OneDrive folder (e.g., OneDrive/Backup)
-
-STEP 3: EXECUTE BACKUP
-• Click "Execute Backup" to start the process
-• The tool will:
-  1. Move your folder to OneDrive
-  2. Create a junction link at the original location
-  3. Your applications will continue working normally
-
-JUNCTION MANAGEMENT:
-• Use "List Junctions" to see all existing junction links
-• Remove unwanted junctions safely
-• Verify junctions are working correctly
-
-IMPORTANT NOTES:
-• Always backup important data before using junction links
-• Ensure OneDrive is syncing properly
-• Junction links only work on the same drive
-• Administrator rights may be required for some operations
-
-WHAT IS A JUNCTION LINK?
-A junction link is like a shortcut that makes a folder appear in two places at once. 
-Your applications see the folder in its original location, but the actual files are 
-stored in OneDrive and synced to the cloud.
-
-TROUBLESHOOTING:
-• If backup fails, check that OneDrive is running
-• Ensure you have write permissions to both locations
-• Try running as administrator if permission errors occur
-• Check Windows Event Viewer for detailed error messages"""
+        # Reopen the window built earlier
+        if self._how_to_window is not None and self._how_to_window.winfo_exists():
+            self._how_to_window.deiconify()
+            self._how_to_window.lift()
+            self._how_to_window.grab_set()
+            return
 
         # Create how-to window
         how_to_window = tk.Toplevel(self.root)
@@ -884,6 +1073,9 @@ TROUBLESHOOTING:
         how_to_window.configure(bg='#2b2b2b')
         how_to_window.transient(self.root)
         how_to_window.grab_set()
+        how_to_window.protocol("WM_DELETE_WINDOW", self._hide_how_to)
+        how_to_window.bind('<Destroy>', self._on_how_to_destroyed)
+        self._how_to_window = how_to_window
 
         # Main frame with scrollbar
         main_frame = tk.Frame(how_to_window, bg='#2b2b2b', padx=20, pady=20)
@@ -920,26 +1112,32 @@ TROUBLESHOOTING:
         text_area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Insert text
-        text_area.insert(tk.END, how_to_text)
+        # Insert text once, in one call into the empty buffer; the window is
+        # reused afterwards so this never runs again for it
+        text_area.insert('1.0', _HOW_TO_TEXT)
         text_area.config(state=tk.DISABLED)
 
         # Close button
-        close_btn = tk.Button(
+        close_btn = ttk.Button(
             main_frame,
             text="Close",
-            command=how_to_window.destroy,
-            font=('Segoe UI', 10),
-            bg='#404040',
-            fg='#ffffff',
-            activebackground='#505050',
-            activeforeground='#ffffff',
-            relief='flat',
-            bd=1,
-            width=10
+            command=self._hide_how_to,
+            width=10,
+            style='Dialog.Plain.TButton'
         )
         close_btn.pack(pady=(15, 0))
 
+    def _hide_how_to(self):
+        """Hide the How To window, it is shown again on the next open"""
+        self._how_to_window.grab_release()
+        self._how_to_window.withdraw()
+
+    def _on_how_to_destroyed(self, event):
+        """Forget the How To window once it is destroyed with the app"""
+        # Children's <Destroy> events reach the toplevel binding too
+        if event.widget is self._how_to_window:
+            self._how_to_window = None
+
     def run(self):
         """Run the application"""
         try:
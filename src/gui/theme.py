@@ -4,8 +4,82 @@ Theme management for OneDrive Custom Backup Tool
 
 import tkinter as tk
 from tkinter import ttk
+import functools
 import logging
-from typing import Dict, Any
+import sys
+import weakref
+from collections import deque
+from types import MappingProxyType
+from typing import Dict, Any, Tuple
+
+
+@functools.lru_cache(maxsize=256)
+def _theme_color(theme_name: str, color_name: str) -> str:
+    """Color lookup shared by all theme managers, keyed by theme and color"""
+    return ThemeManager.THEMES[theme_name].get(color_name, '#000000')
+
+
+# Shared event handlers for styled widgets. Each widget stores its theme in
+# _tm_theme when created, so one set of functions serves every widget.
+
+def _gradient_enter(event):
+    """Highlight a gradient label under the pointer"""
+    event.widget.configure(fg=event.widget._tm_theme['accent2'])
+
+
+def _gradient_leave(event):
+    """Restore a gradient label when the pointer leaves"""
+    event.widget.configure(fg=event.widget._tm_theme['accent'])
+
+
+def _neon_entry_focus_in(event):
+    """Glow the border of a focused neon entry"""
+    theme = event.widget._tm_theme
+    event.widget.configure(
+        highlightbackground=theme['neon_glow'],
+        highlightcolor=theme['neon_glow']
+    )
+
+
+def _neon_entry_focus_out(event):
+    """Restore the border of a neon entry that lost focus"""
+    theme = event.widget._tm_theme
+    event.widget.configure(
+        highlightbackground=theme['accent3'],
+        highlightcolor=theme['accent']
+    )
+
+
+# Style functions for widgets made by the create_* helpers. Each applies the
+# theme colors particular to its kind of widget, see _register_styled.
+
+def _style_accent_label(label, theme):
+    """Color a gradient or glitch label, their effects read _tm_theme"""
+    label._tm_theme = theme
+    label.configure(bg=theme['bg'], fg=theme['accent'])
+
+
+def _style_cyber_frame(frame, theme):
+    """Color a cyber frame"""
+    frame.configure(
+        bg=theme['secondary_bg'],
+        highlightbackground=theme['accent'],
+        highlightcolor=theme['accent2']
+    )
+
+
+def _style_neon_entry(entry, theme):
+    """Color a tk.Entry with neon styling"""
+    entry._tm_theme = theme
+    entry.configure(
+        bg=theme['input_bg'],
+        fg=theme['input_fg'],
+        insertbackground=theme['accent'],
+        selectbackground=theme['accent'],
+        selectforeground=theme['bg'],
+        highlightbackground=theme['accent3'],
+        highlightcolor=theme['accent']
+    )
 
 
 class ThemeManager:
@@ -64,165 +138,340 @@ class ThemeManager:
             'tertiary_bg': '#e5e7eb'
         }
     }
+    # Read-only from here on, with each color string interned so every
+    # widget shares one object per color
+    THEMES = MappingProxyType({
+        name: MappingProxyType({key: sys.intern(color) for key, color in colors.items()})
+        for name, colors in THEMES.items()
+    })
+
+    # Font tuples by (size, weight), shared so Tk sees the same object
+    _FONT_CACHE: Dict[Tuple[int, str], Tuple[str, int, str]] = {}
 
     def __init__(self, root: tk.Tk):
         self.root = root
         self.logger = logging.getLogger(__name__)
         self.current_theme = 'dark'
+        self._themed = False
+
+        # Bumped on every theme change, widgets remember the generation
+        # they were last themed with in _tm_gen
+        self._theme_gen = 0
+
+        # Widgets made by the create_* helpers, restyled directly on a switch
+        self._themed_widgets = weakref.WeakSet()
         self.style = ttk.Style()
 
+        # Hidden widgets wait here until they are shown, see _on_deferred_map;
+        # weak so destroyed widgets are not kept alive
+        self._pending_retheme = weakref.WeakSet()
+        self._retheme_bound = weakref.WeakSet()
+
+        # Options per widget class for the current theme
+        self._widget_configs = self._build_widget_configs(
+            self.THEMES[self.current_theme])
+
         # Initialize style
         self._setup_styles()
 
     def _setup_styles(self):
-        """Setup ttk styles"""
+        """Setup ttk styles, registering one ttk theme per color theme"""
         try:
-            # Use a modern theme as base
+            # Base the themes on clam, like main_window's button styles; the
+            # native vista elements ignore background and foreground maps
             available_themes = self.style.theme_names()
-            if 'vista' in available_themes:
-                self.style.theme_use('vista')
-            elif 'clam' in available_themes:
-                self.style.theme_use('clam')
+            if 'clam' in available_themes:
+                base_theme = 'clam'
             elif 'alt' in available_themes:
-                self.style.theme_use('alt')
+                base_theme = 'alt'
             else:
-                self.style.theme_use('default')
+                base_theme = 'default'
+            self.style.theme_use(base_theme)
+
+            # Styles are registered once here, switching themes is then a
+            # single theme_use instead of reconfiguring every style. tkinter
+            # turns the settings into one Tcl script, so each theme costs a
+            # single call into Tcl
+            for theme_name, theme in self.THEMES.items():
+                ttk_theme = self._ttk_theme_name(theme_name)
+                if ttk_theme not in available_themes:
+                    self.style.theme_create(
+                        ttk_theme, parent=base_theme,
+                        settings=self._ttk_style_settings(theme))
 
         except Exception as e:
             self.logger.error(f"Error setting up styles: {e}")
 
-    def apply_theme(self, theme_name: str):
+    @staticmethod
+    def _ttk_theme_name(theme_name: str) -> str:
+        """Name of the ttk theme registered for a color theme"""
+        return f"odbt_{theme_name}"
+
+    def apply_theme(self, theme_name: str, force: bool = False):
         """
         Apply theme to all widgets
 
         Args:
             theme_name: Theme name ('dark' or 'light')
+            force: Re-apply even if this theme is already applied
         """
         try:
             if theme_name not in self.THEMES:
                 self.logger.warning(f"Unknown theme: {theme_name}")
                 return
 
+            # Nothing to do, widgets created since are themed by the caller
+            # or picked up with force=True
+            if theme_name == self.current_theme and self._themed and not force:
+                return
+
+            if theme_name != self.current_theme:
+                self._theme_gen += 1
             self.current_theme = theme_name
             theme = self.THEMES[theme_name]
 
             # Configure root window
             self.root.configure(bg=theme['bg'])
 
-            # Configure ttk styles
-            self._configure_ttk_styles(theme)
+            # Switch to the ttk styles registered for this theme
+            self.style.theme_use(self._ttk_theme_name(theme_name))
 
-            # Update all existing widgets
-            self._update_widget_colors(self.root, theme)
+            # Helper-made widgets have their own colors; once restyled they
+            # carry the current generation, so the walk below skips them
+            for widget in list(self._themed_widgets):
+                if widget.winfo_exists():
+                    widget._tm_restyle(widget, theme)
+                    widget._tm_gen = self._theme_gen
 
+            # Update all existing widgets. Tk only queues a redraw for each
+            # configure and runs them together on its next idle pass, so the
+            # walk is already one batch; no update() or withdraw is needed
+            self._widget_configs = self._build_widget_configs(theme)
+            self._update_widget_colors(self.root, self._widget_configs)
+
+            self._themed = True
             self.logger.info(f"Applied theme: {theme_name}")
 
         except Exception as e:
             self.logger.error(f"Error applying theme: {e}")
 
-    def _configure_ttk_styles(self, theme: Dict[str, str]):
-        """Configure ttk widget styles"""
-        try:
+    def _ttk_style_settings(self, theme: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """ttk style settings for one theme, in theme_create format"""
+        # Shared by all validation entry styles, only the focus color differs
+        validation_entry = {'fieldbackground': theme['input_bg'],
+                            'foreground': theme['fg'],
+                            'borderwidth': 2,
+                            'relief': 'solid'}
+
+        # clam draws an entry's border from bordercolor/lightcolor/darkcolor;
+        # focuscolor only applies to focus rings and does nothing on entries
+        def focus_border(color):
+            return {'bordercolor': [('focus', color)],
+                    'lightcolor': [('focus', color)],
+                    'darkcolor': [('focus', color)]}
+
+        def validation_style(color_name):
+            return {'configure': validation_entry,
+                    'map': focus_border(theme[color_name])}
+
+        return {
             # Frame styles
-            self.style.configure('TFrame', background=theme['bg'])
+            'TFrame': {
+                'configure': {'background': theme['bg']}
+            },
 
             # Label styles
-            self.style.configure('TLabel',
-                                 background=theme['bg'],
-                                 foreground=theme['fg'])
+            'TLabel': {
+                'configure': {'background': theme['bg'],
+                              'foreground': theme['fg']}
+            },
 
             # Button styles
-            self.style.configure('TButton',
-                                 background=theme['button_bg'],
-                                 foreground=theme['button_fg'],
-                                 borderwidth=2,
-                                 relief='solid',
-                                 padding=(12, 8))
-
-            self.style.map('TButton',
-                           background=[('active', theme['button_hover']),
-                                       ('pressed', theme['accent'])])
+            'TButton': {
+                'configure': {'background': theme['button_bg'],
+                              'foreground': theme['button_fg'],
+                              'borderwidth': 2,
+                              'relief': 'solid',
+                              'padding': (12, 8)},
+                'map': {'background': [('active', theme['button_hover']),
+                                       ('pressed', theme['accent'])]}
+            },
+
+            # Neon button, the glow on hover and press is a state map
+            'Neon.TButton': {
+                'configure': {'background': theme['button_bg'],
+                              'foreground': theme['button_fg'],
+                              'font': self.get_font_config(11, 'bold'),
+                              'borderwidth': 2,
+                              'relief': 'flat',
+                              'padding': (6, 8)},
+                'map': {'background': [('pressed', theme['neon_glow']),
+                                       ('active', theme['button_hover'])],
+                        'foreground': [('pressed', theme['bg']),
+                                       ('active', theme['neon_glow'])],
+                        'relief': [('active', 'solid')]}
+            },
 
             # Entry styles
-            self.style.configure('TEntry',
-                                 fieldbackground=theme['input_bg'],
-                                 foreground=theme['input_fg'],
-                                 borderwidth=2,
-                                 relief='solid')
-
-            self.style.map('TEntry',
-                           focuscolor=[('focus', theme['accent'])])
+            'TEntry': {
+                'configure': {'fieldbackground': theme['input_bg'],
+                              'foreground': theme['input_fg'],
+                              'borderwidth': 2,
+                              'relief': 'solid'},
+                'map': focus_border(theme['accent'])
+            },
+
+            # Neon entry, the border glows while the entry has focus
+            'Neon.TEntry': {
+                'configure': {'fieldbackground': theme['input_bg'],
+                              'foreground': theme['input_fg'],
+                              'insertcolor': theme['accent'],
+                              'selectbackground': theme['accent'],
+                              'selectforeground': theme['bg'],
+                              'bordercolor': theme['accent3'],
+                              'lightcolor': theme['accent3'],
+                              'darkcolor': theme['accent3'],
+                              'borderwidth': 2},
+                'map': focus_border(theme['neon_glow'])
+            },
 
             # Progressbar styles - Cyberpunk style
-            self.style.configure('TProgressbar',
-                                 background=theme['accent'],
-                                 troughcolor=theme['input_bg'],
-                                 borderwidth=2,
-                                 relief='solid',
-                                 lightcolor=theme['accent2'],
-                                 darkcolor=theme['accent3'])
-
-            self.style.map('TProgressbar',
-                           background=[('active', theme['accent2'])])
+            'TProgressbar': {
+                'configure': {'background': theme['accent'],
+                              'troughcolor': theme['input_bg'],
+                              'borderwidth': 2,
+                              'relief': 'solid',
+                              'lightcolor': theme['accent2'],
+                              'darkcolor': theme['accent3']},
+                'map': {'background': [('active', theme['accent2'])]}
+            },
 
             # Validation styles
-            self.style.configure('Valid.TEntry',
-                                 fieldbackground=theme['input_bg'],
-                                 foreground=theme['fg'],
-                                 borderwidth=2,
-                                 relief='solid')
+            'Valid.TEntry': validation_style('success'),
+            'Invalid.TEntry': validation_style('error'),
+            'Success.TEntry': validation_style('success'),
+            'Error.TEntry': validation_style('error'),
+            'Warning.TEntry': validation_style('warning'),
+        }
 
-            self.style.map('Valid.TEntry',
-                           focuscolor=[('focus', theme['success'])])
+    def _build_widget_configs(self, theme: Dict[str, str]) -> Dict[str, Tuple[str, ...]]:
+        """
+        Map tkinter widget classes to the options they take from a theme
 
-            self.style.configure('Invalid.TEntry',
-                                 fieldbackground=theme['input_bg'],
-                                 foreground=theme['fg'],
-                                 borderwidth=2,
-                                 relief='solid')
+        Args:
+            theme: Theme colors
 
-            self.style.map('Invalid.TEntry',
-                           focuscolor=[('focus', theme['error'])])
+        Returns:
+            Ready-made Tcl 'configure' arguments per widget class
+        """
+        window = {'bg': theme['bg']}
+        text_input = {'bg': theme['input_bg'],
+                      'fg': theme['input_fg'],
+                      'insertbackground': theme['fg']}
+        options = {
+            'Tk': window,
+            'Toplevel': window,
+            'Frame': window,
+            'Label': {'bg': theme['bg'], 'fg': theme['fg']},
+            'Button': {'bg': theme['button_bg'],
+                       'fg': theme['button_fg'],
+                       'activebackground': theme['button_hover'],
+                       'activeforeground': theme['button_fg']},
+            'Entry': text_input,
+            'Text': text_input,
+            'Listbox': {'bg': theme['input_bg'],
+                        'fg': theme['input_fg'],
+                        'selectbackground': theme['select_bg'],
+                        'selectforeground': theme['select_fg']},
+        }
 
-        except Exception as e:
-            self.logger.error(f"Error configuring ttk styles: {e}")
+        # Flatten once so each widget is configured with a single Tcl call,
+        # without tkinter re-building the option list for every widget
+        return {
+            widget_class: tuple(arg for name, value in config.items()
+                                for arg in ('-' + name, value))
+            for widget_class, config in options.items()
+        }
 
-    def _update_widget_colors(self, widget, theme: Dict[str, str]):
-        """Recursively update widget colors"""
+    def _update_widget_colors(self, widget, configs: Dict[str, Tuple[str, ...]]):
+        """Update colors of a widget and all its descendants"""
+        # The colors are already resolved per class in configs; also bind
+        # the per-node lookups to locals once for the whole walk
+        generation = self._theme_gen
+        config_for = configs.get
+        tcl_call = self.root.tk.call
+        defer_retheme = self._defer_retheme
+        pending = deque([widget])
+        next_widget = pending.popleft
+        enqueue = pending.extend
+        while pending:
+            widget = next_widget()
+
+            # Already has this theme's colors, only its children may be new
+            if getattr(widget, '_tm_gen', -1) == generation:
+                enqueue(widget.winfo_children())
+                continue
+
+            # Hidden widgets (closed dialogs, unmapped frames) are themed
+            # when they are next shown instead of on every switch
+            if not widget.winfo_ismapped():
+                defer_retheme(widget)
+                continue
+
+            # A widget's class never changes, look it up in Tk only once
+            widget_class = getattr(widget, '_tm_class', None)
+            if widget_class is None:
+                widget_class = widget._tm_class = widget.winfo_class()
+
+            # Only classes in the table are configured, with options they
+            # all support; a widget destroyed mid-walk or that still rejects
+            # an option must not stop the rest of the tree from being themed
+            config = config_for(widget_class)
+            if config:
+                try:
+                    tcl_call(widget._w, 'configure', *config)
+                except tk.TclError as e:
+                    if not widget.winfo_exists():
+                        continue
+                    self.logger.debug(f"Could not theme {widget}: {e}")
+            widget._tm_gen = generation
+
+            enqueue(widget.winfo_children())
+
+    def _defer_retheme(self, widget):
+        """Theme a hidden widget and its children once it is mapped"""
+        self._pending_retheme.add(widget)
+        if widget not in self._retheme_bound:
+            # Bound once and left in place, unbinding one callback would
+            # drop any other <Map> bindings on the widget too
+            widget.bind('<Map>', self._on_deferred_map, add='+')
+            self._retheme_bound.add(widget)
+
+    def _on_deferred_map(self, event):
+        """Apply the current theme to a deferred widget that was just shown"""
+        widget = event.widget
+        if widget not in self._pending_retheme:
+            # A child of a deferred toplevel, or already themed
+            return
+        self._pending_retheme.discard(widget)
         try:
-            widget_class = widget.winfo_class()
-
-            # Update tkinter widgets
-            if widget_class in ['Tk', 'Toplevel', 'Frame']:
-                widget.configure(bg=theme['bg'])
-            elif widget_class == 'Label':
-                widget.configure(bg=theme['bg'], fg=theme['fg'])
-            elif widget_class == 'Button':
-                widget.configure(bg=theme['button_bg'],
-                                 fg=theme['button_fg'],
-                                 activebackground=theme['button_hover'],
-                                 activeforeground=theme['button_fg'])
-            elif widget_class == 'Entry':
-                widget.configure(bg=theme['input_bg'],
-                                 fg=theme['input_fg'],
-                                 insertbackground=theme['fg'])
-            elif widget_class == 'Text':
-                widget.configure(bg=theme['input_bg'],
-                                 fg=theme['input_fg'],
-                                 insertbackground=theme['fg'])
-            elif widget_class == 'Listbox':
-                widget.configure(bg=theme['input_bg'],
-                                 fg=theme['input_fg'],
-                                 selectbackground=theme['select_bg'],
-                                 selectforeground=theme['select_fg'])
-
-            # Recursively update children
-            for child in widget.winfo_children():
-                self._update_widget_colors(child, theme)
+            self._update_widget_colors(widget, self._widget_configs)
+        except tk.TclError as e:
+            # Tk callback, the widget may be torn down while being shown
+            self.logger.error(f"Error applying deferred theme: {e}")
 
-        except Exception as e:
-            # Some widgets might not support certain configurations
-            pass
+    def _register_styled(self, widget, style):
+        """
+        Style a helper-made widget and keep it restyled on theme switches
+
+        Args:
+            widget: Widget created by one of the create_* helpers
+            style: Style function taking (widget, theme)
+        """
+        widget._tm_restyle = style
+        style(widget, self.THEMES[self.current_theme])
+        widget._tm_gen = self._theme_gen
+        self._themed_widgets.add(widget)
 
     def get_theme_color(self, color_name: str) -> str:
         """
@@ -234,45 +483,7 @@ class ThemeManager:
         Returns:
             Color value
         """
-        return self.THEMES[self.current_theme].get(color_name, '#000000')
-
-    def create_validation_styles(self):
-        """Create validation-specific styles"""
-        try:
-            theme = self.THEMES[self.current_theme]
-
-            # Success style
-            self.style.configure('Success.TEntry',
-                                 fieldbackground=theme['input_bg'],
-                                 foreground=theme['fg'],
-                                 borderwidth=2,
-                                 relief='solid')
-
-            self.style.map('Success.TEntry',
-                           focuscolor=[('focus', theme['success'])])
-
-            # Error style
-            self.style.configure('Error.TEntry',
-                                 fieldbackground=theme['input_bg'],
-                                 foreground=theme['fg'],
-                                 borderwidth=2,
-                                 relief='solid')
-
-            self.style.map('Error.TEntry',
-                           focuscolor=[('focus', theme['error'])])
-
-            # Warning style
-            self.style.configure('Warning.TEntry',
-                                 fieldbackground=theme['input_bg'],
-                                 foreground=theme['fg'],
-                                 borderwidth=2,
-                                 relief='solid')
-
-            self.style.map('Warning.TEntry',
-                           focuscolor=[('focus', theme['warning'])])
-
-        except Exception as e:
-            self.logger.error(f"Error creating validation styles: {e}")
+        return _theme_color(self.current_theme, color_name)
 
     def apply_validation_style(self, widget, style_name: str):
         """
@@ -306,7 +517,11 @@ class ThemeManager:
         Returns:
             Font configuration tuple
         """
-        return ('Segoe UI', size, weight)
+        key = (size, weight)
+        font = self._FONT_CACHE.get(key)
+        if font is None:
+            font = self._FONT_CACHE[key] = ('Segoe UI', size, weight)
+        return font
 
     def create_gradient_label(self, parent, text: str, font_size: int = 12, font_weight: str = 'bold') -> tk.Label:
         """
@@ -322,28 +537,19 @@ class ThemeManager:
             Styled label widget
         """
         try:
-            theme = self.THEMES[self.current_theme]
-
             # Create label with special styling
             label = tk.Label(
                 parent,
                 text=text,
                 font=self.get_font_config(font_size, font_weight),
-                bg=theme['bg'],
-                fg=theme['accent'],
                 relief='flat',
                 pady=5
             )
+            self._register_styled(label, _style_accent_label)
 
             # Add hover effect
-            def on_enter(event):
-                label.configure(fg=theme['accent2'])
-
-            def on_leave(event):
-                label.configure(fg=theme['accent'])
-
-            label.bind('<Enter>', on_enter)
-            label.bind('<Leave>', on_leave)
+            label.bind('<Enter>', _gradient_enter)
+            label.bind('<Leave>', _gradient_leave)
 
             return label
 
@@ -352,7 +558,7 @@ class ThemeManager:
             # Fallback to regular label
             return tk.Label(parent, text=text, font=self.get_font_config(font_size, font_weight))
 
-    def create_neon_button(self, parent, text: str, command=None, width: int = 20) -> tk.Button:
+    def create_neon_button(self, parent, text: str, command=None, width: int = 20) -> ttk.Button:
         """
         Create a neon-styled button with cyberpunk effects
 
@@ -366,62 +572,21 @@ class ThemeManager:
             Styled button widget
         """
         try:
-            theme = self.THEMES[self.current_theme]
-
-            # Create button with neon styling
-            button = tk.Button(
+            # Hover and press colors come from the Neon.TButton style map,
+            # Tk switches them itself without calling back into Python
+            return ttk.Button(
                 parent,
                 text=text,
                 command=command,
-                font=self.get_font_config(11, 'bold'),
-                bg=theme['button_bg'],
-                fg=theme['button_fg'],
-                activebackground=theme['button_active'],
-                activeforeground=theme['bg'],
-                relief='flat',
-                bd=2,
+                style='Neon.TButton',
                 width=width,
-                pady=8,
                 cursor='hand2'
             )
 
-            # Add neon glow effect
-            def on_enter(event):
-                button.configure(
-                    bg=theme['button_hover'],
-                    fg=theme['neon_glow'],
-                    relief='solid',
-                    bd=2
-                )
-
-            def on_leave(event):
-                button.configure(
-                    bg=theme['button_bg'],
-                    fg=theme['button_fg'],
-                    relief='flat',
-                    bd=2
-                )
-
-            def on_click(event):
-                button.configure(
-                    bg=theme['neon_glow'],
-                    fg=theme['bg']
-                )
-                button.after(100, lambda: button.configure(
-                    bg=theme['button_hover'],
-                    fg=theme['neon_glow']
-                ))
-
-            button.bind('<Enter>', on_enter)
-            button.bind('<Leave>', on_leave)
-            button.bind('<Button-1>', on_click)
-
-            return button
-
         except Exception as e:
             self.logger.error(f"Error creating neon button: {e}")
             # Fallback to regular button
-            return tk.Button(parent, text=text, command=command, width=width)
+            return ttk.Button(parent, text=text, command=command, width=width)
 
     def create_cyber_frame(self, parent, padding: int = 20) -> tk.Frame:
         """
@@ -435,17 +600,13 @@ class ThemeManager:
             Styled frame widget
         """
         try:
-            theme = self.THEMES[self.current_theme]
-
             frame = tk.Frame(
                 parent,
-                bg=theme['secondary_bg'],
                 relief='solid',
                 bd=1,
-                highlightbackground=theme['accent'],
-                highlightcolor=theme['accent2'],
                 highlightthickness=1
             )
+            self._register_styled(frame, _style_cyber_frame)
 
             return frame
 
@@ -454,45 +615,31 @@ class ThemeManager:
             # Fallback to regular frame
             return tk.Frame(parent, bg=self.THEMES[self.current_theme]['bg'])
 
-    def apply_neon_entry_style(self, entry: tk.Entry):
+    def apply_neon_entry_style(self, entry):
         """
         Apply neon styling to entry widget
 
         Args:
-            entry: Entry widget to style
+            entry: Entry widget to style, ttk.Entry or tk.Entry
         """
         try:
-            theme = self.THEMES[self.current_theme]
+            # ttk entries get the focus glow from the Neon.TEntry state map
+            if isinstance(entry, ttk.Entry):
+                entry.configure(style='Neon.TEntry',
+                                font=self.get_font_config(10))
+                return
 
             entry.configure(
-                bg=theme['input_bg'],
-                fg=theme['input_fg'],
-                insertbackground=theme['accent'],
-                selectbackground=theme['accent'],
-                selectforeground=theme['bg'],
                 relief='solid',
                 bd=2,
-                highlightbackground=theme['accent3'],
-                highlightcolor=theme['accent'],
                 highlightthickness=1,
                 font=self.get_font_config(10)
             )
+            self._register_styled(entry, _style_neon_entry)
 
             # Add focus effects
-            def on_focus_in(event):
-                entry.configure(
-                    highlightbackground=theme['neon_glow'],
-                    highlightcolor=theme['neon_glow']
-                )
-
-            def on_focus_out(event):
-                entry.configure(
-                    highlightbackground=theme['accent3'],
-                    highlightcolor=theme['accent']
-                )
-
-            entry.bind('<FocusIn>', on_focus_in)
-            entry.bind('<FocusOut>', on_focus_out)
+            entry.bind('<FocusIn>', _neon_entry_focus_in)
+            entry.bind('<FocusOut>', _neon_entry_focus_out)
 
         except Exception as e:
             self.logger.error(f"Error applying neon entry style: {e}")
@@ -510,29 +657,32 @@ class ThemeManager:
             Styled label with glitch effect
         """
         try:
-            theme = self.THEMES[self.current_theme]
-
             label = tk.Label(
                 parent,
                 text=text,
                 font=self.get_font_config(font_size, 'bold'),
-                bg=theme['bg'],
-                fg=theme['accent'],
                 relief='flat'
             )
+            self._register_styled(label, _style_accent_label)
 
-            # Create glitch animation
-            colors = [theme['accent'], theme['accent2'], theme['accent3']]
+            # Create glitch animation, colors follow the current theme
+            color_names = ('accent', 'accent2', 'accent3')
             current_color = 0
 
             def glitch_effect():
                 nonlocal current_color
-                label.configure(fg=colors[current_color])
-                current_color = (current_color + 1) % len(colors)
-                label.after(2000, glitch_effect)  # Change every 2 seconds
+                label.configure(
+                    fg=label._tm_theme[color_names[current_color]])
+                current_color = (current_color + 1) % len(color_names)
+                label._tm_after = label.after(2000, glitch_effect)  # Change every 2 seconds
+
+            def stop_glitch(event):
+                # Otherwise the timer keeps firing for a destroyed label
+                label.after_cancel(label._tm_after)
 
             # Start glitch effect
             glitch_effect()
+            label.bind('<Destroy>', stop_glitch)
 
             return label
 
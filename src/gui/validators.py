@@ -6,21 +6,65 @@ import tkinter as tk
 from tkinter import ttk
 import logging
 import os
+import functools
+import random
+import stat
+from collections import OrderedDict
 from typing import Optional, Callable
-from pathlib import Path
-import threading
 import time
 
 from utils.paths import PathUtils
 
 
+# Entry options per validation state as (background, foreground, relief, border width)
+_STYLES = {
+    'success': ('#404040', '#00ff00', 'solid', 1),
+    'error': ('#404040', '#ff4444', 'solid', 1),
+    'warning': ('#404040', '#ffff00', 'solid', 1),
+    'normal': ('#404040', '#ffffff', 'flat', 2),
+}
+
+# Validation kind -> (PathUtils validator, optional OneDrive check for a warning)
+_VALIDATORS = {
+    'source': ('validate_source_path', None),
+    'target': ('validate_target_path', '_is_onedrive_path'),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _suggest_impl(source_path: str, onedrive_path: str) -> str:
+    """Build the suggested OneDrive target for a source folder"""
+    # Get folder name from source path
+    source_name = os.path.basename(os.path.normpath(source_path))
+
+    # Create suggested path
+    return os.path.join(onedrive_path, "Backup", source_name)
+
+
 class PathValidator:
     """Handles real-time path validation with visual feedback"""
 
+    # Validation results kept, in entries and in seconds
+    _CACHE_MAX = 256
+    _CACHE_TTL = 5.0
+    # Status messages go stale sooner than the entry styling
+    _MESSAGE_TTL = 2.0
+
+    # Existence checks are reused for this many seconds, except that one
+    # lookup in _EXISTS_RECHECK re-stats anyway to catch changes early
+    _EXISTS_TTL = 2.0
+    _EXISTS_RECHECK = 10
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.path_utils = PathUtils()
-        self.validation_cache = {}
+        # The caches and timers below are only touched from the Tk main
+        # thread (validation runs from after() callbacks), so no lock
+        # Least recently used first, see _cache_get and _cache_put
+        self.validation_cache = OrderedDict()
+        # Path -> (timestamp, exists), see _path_exists_cached
+        self._exists_cache = {}
+        # Pending Tk after() jobs as widget id -> (widget, after id)
         self.validation_timers = {}
 
     def validate_source_realtime(self, widget, path: str) -> bool:
@@ -34,24 +78,7 @@ class PathValidator:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            # Cancel previous timer if exists
-            widget_id = str(widget)
-            if widget_id in self.validation_timers:
-                self.validation_timers[widget_id].cancel()
-
-            # Schedule validation with delay to avoid excessive calls
-            timer = threading.Timer(
-                0.5, self._validate_source_delayed, args=(widget, path))
-            self.validation_timers[widget_id] = timer
-            timer.start()
-
-            return True  # Return True for now, actual validation is delayed
-
-        except Exception as e:
-            self.logger.error(f"Error in real-time source validation: {e}")
-            self._set_validation_style(widget, 'error')
-            return False
+        return self._validate_realtime(widget, path, 'source')
 
     def validate_target_realtime(self, widget, path: str) -> bool:
         """
@@ -64,123 +91,134 @@ class PathValidator:
         Returns:
             True if valid, False otherwise
         """
+        return self._validate_realtime(widget, path, 'target')
+
+    def _validate_realtime(self, widget, path: str, kind: str) -> bool:
+        """
+        Schedule a debounced validation of a source or target path
+
+        Args:
+            widget: Entry widget to provide feedback
+            path: Path to validate
+            kind: Key into _VALIDATORS ('source' or 'target')
+
+        Returns:
+            True if scheduled, False otherwise
+        """
         try:
             # Cancel previous timer if exists
             widget_id = str(widget)
             if widget_id in self.validation_timers:
-                self.validation_timers[widget_id].cancel()
+                widget.after_cancel(self.validation_timers[widget_id][1])
 
-            # Schedule validation with delay to avoid excessive calls
-            timer = threading.Timer(
-                0.5, self._validate_target_delayed, args=(widget, path))
-            self.validation_timers[widget_id] = timer
-            timer.start()
+            # Schedule validation with delay to avoid excessive calls. Tk's
+            # own timer runs it on the main thread, no thread per keystroke
+            after_id = widget.after(
+                500, self._validate_delayed, widget, path, kind)
+            self.validation_timers[widget_id] = (widget, after_id)
 
             return True  # Return True for now, actual validation is delayed
 
         except Exception as e:
-            self.logger.error(f"Error in real-time target validation: {e}")
+            self.logger.error(f"Error in real-time {kind} validation: {e}")
             self._set_validation_style(widget, 'error')
             return False
 
-    def _validate_source_delayed(self, widget, path: str):
-        """Delayed source validation"""
+    def _validate_delayed(self, widget, path: str, kind: str):
+        """Delayed source or target validation"""
+        self.validation_timers.pop(str(widget), None)
         try:
             if not path.strip():
                 self._set_validation_style(widget, 'normal')
                 return
 
             # Check cache first
-            cache_key = f"source:{path}"
-            if cache_key in self.validation_cache:
-                cached_result = self.validation_cache[cache_key]
-                # 5 second cache
-                if time.time() - cached_result['timestamp'] < 5:
-                    self._set_validation_style(widget,
-                                               'success' if cached_result['valid'] else 'error')
-                    return
-
-            # Perform validation
-            is_valid, error_msg = self.path_utils.validate_source_path(path)
-
-            # Cache result
-            self.validation_cache[cache_key] = {
-                'valid': is_valid,
-                'error': error_msg,
-                'timestamp': time.time()
-            }
-
-            # Update UI on main thread
-            widget.after(0, self._set_validation_style, widget,
-                         'success' if is_valid else 'error')
+            cache_key = f"{kind}:{path}"
+            now = time.monotonic()
+            result = self._cache_get(cache_key, now=now)
+            if result is None:
+                validator_name, onedrive_check = _VALIDATORS[kind]
+                is_valid, error_msg = getattr(
+                    self.path_utils, validator_name)(path)
+                result = {
+                    'valid': is_valid,
+                    'error': error_msg,
+                    'timestamp': now
+                }
+                if onedrive_check:
+                    # Non-OneDrive targets are still valid but get a
+                    # warning style
+                    result['is_onedrive'] = is_valid and getattr(
+                        self.path_utils, onedrive_check)(path)
+                self._cache_put(cache_key, result)
 
-            if not is_valid:
-                self.logger.debug(f"Source validation failed: {error_msg}")
+                if not is_valid:
+                    self.logger.debug(
+                        "%s validation failed: %s", kind.capitalize(), error_msg)
 
-        except Exception as e:
-            self.logger.error(f"Error in delayed source validation: {e}")
-            widget.after(0, self._set_validation_style, widget, 'error')
+            # Already on the Tk main thread, style the entry directly
+            self._set_validation_style(widget, self._result_style(result))
 
-    def _validate_target_delayed(self, widget, path: str):
-        """Delayed target validation"""
-        try:
-            if not path.strip():
-                self._set_validation_style(widget, 'normal')
-                return
+        except Exception:
+            self.logger.exception("Error in delayed %s validation", kind)
+            self._set_validation_style(widget, 'error')
 
-            # Check cache first
-            cache_key = f"target:{path}"
-            if cache_key in self.validation_cache:
-                cached_result = self.validation_cache[cache_key]
-                # 5 second cache
-                if time.time() - cached_result['timestamp'] < 5:
-                    self._set_validation_style(widget,
-                                               'success' if cached_result['valid'] else 'error')
-                    return
-
-            # Perform validation
-            is_valid, error_msg = self.path_utils.validate_target_path(path)
-
-            # Special handling for OneDrive path suggestion
-            if is_valid and not self.path_utils._is_onedrive_path(Path(path)):
-                # Show warning style for non-OneDrive paths
-                self._set_validation_style(widget, 'warning')
-                is_valid = True  # Still valid, just not in OneDrive
-            else:
-                # Cache result
-                self.validation_cache[cache_key] = {
-                    'valid': is_valid,
-                    'error': error_msg,
-                    'timestamp': time.time()
-                }
+    @staticmethod
+    def _result_style(result: dict) -> str:
+        """Pick the validation style for a cached result"""
+        if not result['valid']:
+            return 'error'
+        return 'success' if result.get('is_onedrive', True) else 'warning'
 
-                # Update UI on main thread
-                widget.after(0, self._set_validation_style, widget,
-                             'success' if is_valid else 'error')
+    def _cache_get(self, key: str, ttl: Optional[float] = None,
+                   now: Optional[float] = None) -> Optional[dict]:
+        """
+        Look up a fresh validation result
 
-            if not is_valid:
-                self.logger.debug(f"Target validation failed: {error_msg}")
+        Args:
+            key: Cache key
+            ttl: Maximum age in seconds, defaults to _CACHE_TTL
+            now: Current time.monotonic() value, if the caller already has one
 
-        except Exception as e:
-            self.logger.error(f"Error in delayed target validation: {e}")
-            widget.after(0, self._set_validation_style, widget, 'error')
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        result = self.validation_cache.get(key)
+        if result is None:
+            return None
+        if now is None:
+            now = time.monotonic()
+        if now - result['timestamp'] >= (ttl or self._CACHE_TTL):
+            del self.validation_cache[key]
+            return None
+        self.validation_cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key: str, result: dict):
+        """Store a validation result, evicting the least recently used"""
+        self.validation_cache[key] = result
+        self.validation_cache.move_to_end(key)
+        while len(self.validation_cache) > self._CACHE_MAX:
+            self.validation_cache.popitem(last=False)
 
     def _set_validation_style(self, widget, style: str):
         """Set validation style on widget"""
         try:
-            # Simple styling for basic tk.Entry widgets
-            if style == 'success':
-                widget.configure(bg='#404040', fg='#00ff00',
-                                 relief='solid', bd=1)
-            elif style == 'error':
-                widget.configure(bg='#404040', fg='#ff4444',
-                                 relief='solid', bd=1)
-            elif style == 'warning':
-                widget.configure(bg='#404040', fg='#ffff00',
-                                 relief='solid', bd=1)
-            else:
-                widget.configure(bg='#404040', fg='#ffffff',
-                                 relief='flat', bd=2)
+            # Unknown styles look like 'normal', so compare them as such
+            if style not in _STYLES:
+                style = 'normal'
+
+            # Keystrokes that keep the same state need no reconfigure
+            if getattr(widget, '_vstyle', None) == style:
+                return
+
+            # Simple styling for basic tk.Entry widgets, straight to Tcl
+            # to skip Tkinter's keyword option translation
+            bg, fg, relief, bd = _STYLES[style]
+            widget.tk.call(widget._w, 'configure',
+                           '-background', bg, '-foreground', fg,
+                           '-relief', relief, '-borderwidth', bd)
+            widget._vstyle = style
 
         except Exception as e:
             self.logger.error(f"Error setting validation style: {e}")
@@ -210,15 +248,15 @@ class PathValidator:
         try:
             self.validation_cache.clear()
             self.logger.debug("Validation cache cleared")
-        except Exception as e:
-            self.logger.error(f"Error clearing validation cache: {e}")
+        except Exception:
+            self.logger.exception("Error clearing validation cache")
 
     def cleanup(self):
         """Cleanup resources"""
         try:
             # Cancel all pending timers
-            for timer in self.validation_timers.values():
-                timer.cancel()
+            for widget, after_id in self.validation_timers.values():
+                widget.after_cancel(after_id)
             self.validation_timers.clear()
 
             # Clear cache
@@ -226,8 +264,8 @@ class PathValidator:
 
             self.logger.debug("PathValidator cleanup completed")
 
-        except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+        except Exception:
+            self.logger.exception("Error during cleanup")
 
     def get_validation_message(self, path: str, path_type: str = 'source') -> str:
         """
@@ -241,12 +279,20 @@ class PathValidator:
             Validation message
         """
         try:
+            cache_key = f"message:{path_type}:{path}"
+            now = time.monotonic()
+            cached_result = self._cache_get(cache_key, self._MESSAGE_TTL, now)
+            if cached_result is not None:
+                return cached_result['message']
+
             is_valid, error_msg = self.validate_immediately(path, path_type)
+            message = "Path is valid" if is_valid else error_msg
 
-            if is_valid:
-                return "Path is valid"
-            else:
-                return error_msg
+            self._cache_put(cache_key, {
+                'message': message,
+                'timestamp': now
+            })
+            return message
 
         except Exception as e:
             return f"Validation error: {str(e)}"
@@ -266,13 +312,7 @@ class PathValidator:
             if not onedrive_path:
                 return ""
 
-            # Get folder name from source path
-            source_name = Path(source_path).name
-
-            # Create suggested path
-            suggested_path = Path(onedrive_path) / "Backup" / source_name
-
-            return str(suggested_path)
+            return _suggest_impl(source_path, onedrive_path)
 
         except Exception as e:
             self.logger.error(f"Error suggesting OneDrive path: {e}")
@@ -289,10 +329,32 @@ class PathValidator:
             True if path is available (doesn't exist)
         """
         try:
-            return not Path(path).exists()
+            return not self._path_exists_cached(path)
         except Exception:
             return False
 
+    def _path_exists_cached(self, path: str) -> bool:
+        """
+        Check if a path exists, reusing recent answers
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if something exists at path, including a broken link
+        """
+        now = time.monotonic()
+        cached = self._exists_cache.get(path)
+        if (cached is not None and now - cached[0] < self._EXISTS_TTL
+                and random.randrange(self._EXISTS_RECHECK)):
+            return cached[1]
+
+        exists = os.path.lexists(path)
+        if len(self._exists_cache) >= self._CACHE_MAX:
+            self._exists_cache.clear()
+        self._exists_cache[path] = (now, exists)
+        return exists
+
     def get_path_info(self, path: str) -> dict:
         """
         Get detailed path information
@@ -304,24 +366,36 @@ class PathValidator:
             Dictionary with path information
         """
         try:
-            path_obj = Path(path)
+            # Junction status and target come from one reparse point read
+            is_junction, junction_target = self.path_utils.get_junction_info_atomic(
+                path)
+
+            # One stat of the path, and a cached check of its parent; every
+            # other flag is derived from those results
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            exists = st is not None
+
+            parent = os.path.dirname(os.path.abspath(path))
+            parent_exists = self._path_exists_cached(parent)
 
             info = {
-                'exists': path_obj.exists(),
-                'is_dir': path_obj.is_dir() if path_obj.exists() else False,
-                'is_file': path_obj.is_file() if path_obj.exists() else False,
-                'is_junction': self.path_utils.is_junction(path),
-                'is_onedrive': self.path_utils._is_onedrive_path(path_obj) if path_obj.exists() else False,
-                'parent_exists': path_obj.parent.exists(),
-                'readable': path_obj.exists() and os.access(path_obj, os.R_OK),
-                'writable': path_obj.parent.exists() and os.access(path_obj.parent, os.W_OK),
-                'size': path_obj.stat().st_size if path_obj.exists() else 0,
-                'absolute_path': str(path_obj.resolve())
+                'exists': exists,
+                'is_dir': exists and stat.S_ISDIR(st.st_mode),
+                'is_file': exists and stat.S_ISREG(st.st_mode),
+                'is_junction': is_junction,
+                'is_onedrive': self.path_utils._is_onedrive_path(path) if exists else False,
+                'parent_exists': parent_exists,
+                'readable': exists and os.access(path, os.R_OK),
+                'writable': parent_exists and os.access(parent, os.W_OK),
+                'size': st.st_size if exists else 0,
+                'absolute_path': os.path.realpath(path)
             }
 
-            if info['is_junction']:
-                info['junction_target'] = self.path_utils.get_junction_target(
-                    path)
+            if is_junction:
+                info['junction_target'] = junction_target
 
             return info
 
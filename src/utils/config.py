@@ -4,10 +4,73 @@ Application configuration for OneDrive Custom Backup Tool
 
 import json
 import os
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
+try:
+    # Optional fast JSON parser, the standard library is used otherwise
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Default configuration, copied per AppConfig instance
+_DEFAULT_CONFIG = {
+    "ui": {
+        "theme": "dark",  # dark or light
+        "window_size": "500x200",
+        "remember_paths": True,
+        "auto_detect_onedrive": True
+    },
+    "backup": {
+        "verify_after_backup": True,
+        "create_rollback_point": True,
+        "timeout_seconds": 300,
+        "min_free_space_mb": 100
+    },
+    "logging": {
+        "level": "INFO",
+        "max_file_size_mb": 10,
+        "backup_count": 5,
+        "console_output": True
+    },
+    "paths": {
+        "last_source": "",
+        "last_target": "",
+        "onedrive_path": "",
+        "temp_dir": ""
+    },
+    "advanced": {
+        "check_admin_rights": True,
+        "enable_cli": True,
+        "auto_update_check": False
+    }
+}
+
+
+def _open_ro(path: str):
+    """Open a file for binary reading without updating its access time where supported"""
+    flags = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+    noatime = getattr(os, 'O_NOATIME', 0)
+    try:
+        fd = os.open(path, flags | noatime)
+    except PermissionError:
+        # O_NOATIME needs file ownership, retry with a plain open
+        if not noatime:
+            raise
+        fd = os.open(path, flags)
+    return os.fdopen(fd, 'rb', buffering=65536)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file, cached until the file is modified"""
+    with _open_ro(path) as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
 
 class AppConfig:
     """Application configuration manager"""
@@ -15,61 +78,41 @@ class AppConfig:
     def __init__(self, config_file: Optional[str] = None):
         self.logger = logging.getLogger(__name__)
 
-        # Default config file location
+        # Default config file location, created by save_config when needed
         if not config_file:
-            config_dir = Path.home() / ".onedrive-backup-tool"
-            config_dir.mkdir(exist_ok=True)
-            config_file = config_dir / "config.json"
+            config_file = Path.home() / ".onedrive-backup-tool" / "config.json"
 
         self.config_file = Path(config_file)
         self.config = self._load_default_config()
-        self._load_config()
+
+        # The file is read on first use rather than during startup
+        self._loaded = False
 
     def _load_default_config(self) -> Dict[str, Any]:
         """Load default configuration"""
-        return {
-            "ui": {
-                "theme": "dark",  # dark or light
-                "window_size": "500x200",
-                "remember_paths": True,
-                "auto_detect_onedrive": True
-            },
-            "backup": {
-                "verify_after_backup": True,
-                "create_rollback_point": True,
-                "timeout_seconds": 300,
-                "min_free_space_mb": 100
-            },
-            "logging": {
-                "level": "INFO",
-                "max_file_size_mb": 10,
-                "backup_count": 5,
-                "console_output": True
-            },
-            "paths": {
-                "last_source": "",
-                "last_target": "",
-                "onedrive_path": "",
-                "temp_dir": ""
-            },
-            "advanced": {
-                "check_admin_rights": True,
-                "enable_cli": True,
-                "auto_update_check": False
-            }
-        }
+        # Leaf values are immutable, so copying each section is enough
+        return {section: dict(values) if isinstance(values, dict) else values
+                for section, values in _DEFAULT_CONFIG.items()}
+
+    def _ensure_loaded(self):
+        """Load the configuration file the first time a value is used"""
+        if not self._loaded:
+            self._loaded = True
+            self._load_config()
 
     def _load_config(self):
         """Load configuration from file"""
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    file_config = json.load(f)
-                    self._merge_config(file_config)
-                self.logger.info(
-                    f"Configuration loaded from {self.config_file}")
-            else:
+            try:
+                mtime_ns = os.stat(self.config_file).st_mtime_ns
+            except FileNotFoundError:
                 self.logger.info("Using default configuration")
+                return
+
+            file_config = _parse_config_file(str(self.config_file), mtime_ns)
+            self._merge_config(file_config)
+            self.logger.info(
+                f"Configuration loaded from {self.config_file}")
         except Exception as e:
             self.logger.error(f"Error loading configuration: {e}")
             self.logger.info("Using default configuration")
@@ -83,14 +126,26 @@ class AppConfig:
                 else:
                     self.config[section] = values
             else:
-                self.config[section] = values
+                # Copy so later set() calls don't touch the cached parse
+                self.config[section] = dict(values) if isinstance(
+                    values, dict) else values
 
     def save_config(self):
         """Save configuration to file"""
+        # Keep settings from the file that were never read this session
+        self._ensure_loaded()
         try:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.config, indent=2).encode('utf-8')
+
+            # Serialize first and write once, then swap the file in so a
+            # crash mid-write cannot leave a truncated config behind
+            tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.config_file)
             self.logger.info(f"Configuration saved to {self.config_file}")
         except Exception as e:
             self.logger.error(f"Error saving configuration: {e}")
@@ -107,10 +162,14 @@ class AppConfig:
         Returns:
             Configuration value
         """
-        try:
-            return self.config.get(section, {}).get(key, default)
-        except Exception:
+        self._ensure_loaded()
+
+        # Default sections always exist; a section from the file may be
+        # missing or not a dict
+        values = self.config.get(section)
+        if not isinstance(values, dict):
             return default
+        return values.get(key, default)
 
     def set(self, section: str, key: str, value: Any):
         """
@@ -121,6 +180,7 @@ class AppConfig:
             key: Configuration key
             value: Value to set
         """
+        self._ensure_loaded()
         if section not in self.config:
             self.config[section] = {}
         self.config[section][key] = value
@@ -2,12 +2,28 @@
 Logging configuration for OneDrive Custom Backup Tool
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
 from datetime import datetime
 
+# Background thread writing queued records to the real handlers
+_listener = None
+
+
+def _stop_listener():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging(verbose: bool = False, log_file: str = None) -> logging.Logger:
     """
@@ -36,9 +52,15 @@ def setup_logging(verbose: bool = False, log_file: str = None) -> logging.Logger
     logger = logging.getLogger()
     logger.setLevel(log_level)
 
-    # Clear existing handlers
+    # Clear existing handlers, flushing any from an earlier setup
+    _stop_listener()
     logger.handlers.clear()
 
+    # The formatters use neither, so don't collect them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Create formatters
     detailed_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -57,7 +79,6 @@ def setup_logging(verbose: bool = False, log_file: str = None) -> logging.Logger
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
 
     # Console handler
     console_handler = logging.StreamHandler()
@@ -71,7 +92,14 @@ def setup_logging(verbose: bool = False, log_file: str = None) -> logging.Logger
         # Fallback for older Python versions
         pass
 
-    logger.addHandler(console_handler)
+    # Callers only enqueue records; file and console output, including
+    # rotation, happen on the listener's thread
+    global _listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
 
     # Log startup message
     logger.info("OneDrive Custom Backup Tool - Logging initialized")
@@ -4,20 +4,298 @@ Windows path utilities for OneDrive Custom Backup Tool
 
 import os
 import sys
+import shutil
+import stat
+import struct
 from pathlib import Path
 from typing import Tuple, Optional
-import subprocess
 import logging
+import time
+
+# Win32 constants for reparse point inspection
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+FILE_ATTRIBUTE_DIRECTORY = 0x00000010
+FILE_ATTRIBUTE_REPARSE_POINT = 0x00000400
+IO_REPARSE_TAG_MOUNT_POINT = 0xA0000003
+IO_REPARSE_TAG_NAME_SURROGATE_BIT = 0x20000000
+FILE_SHARE_ALL = 0x00000007  # FILE_SHARE_READ | FILE_SHARE_WRITE | FILE_SHARE_DELETE
+GENERIC_WRITE = 0x40000000
+OPEN_EXISTING = 3
+FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+FILE_FLAG_OPEN_REPARSE_POINT = 0x00200000
+FSCTL_GET_REPARSE_POINT = 0x000900A8
+FSCTL_SET_REPARSE_POINT = 0x000900A4
+MAXIMUM_REPARSE_DATA_BUFFER_SIZE = 16 * 1024
+
+# Filename sanitizing: characters Windows rejects, and reserved device names
+_INVALID_CHARS = '<>:"/\\|?*'
+_UNSAFE_TABLE = str.maketrans(dict.fromkeys(_INVALID_CHARS, '_'))
+_RESERVED_NAMES = frozenset((
+    'CON', 'PRN', 'AUX', 'NUL',
+    *(f'COM{i}' for i in range(1, 10)),
+    *(f'LPT{i}' for i in range(1, 10)),
+))
+
+if sys.platform == "win32":
+    import ctypes
+    import winreg
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _GetFileAttributesW = _kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [wintypes.LPCWSTR]
+    _GetFileAttributesW.restype = wintypes.DWORD
+
+    _CreateFileW = _kernel32.CreateFileW
+    _CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD,
+                             wintypes.LPVOID, wintypes.DWORD, wintypes.DWORD,
+                             wintypes.HANDLE]
+    _CreateFileW.restype = wintypes.HANDLE
+
+    _DeviceIoControl = _kernel32.DeviceIoControl
+    _DeviceIoControl.argtypes = [wintypes.HANDLE, wintypes.DWORD,
+                                 wintypes.LPVOID, wintypes.DWORD,
+                                 wintypes.LPVOID, wintypes.DWORD,
+                                 ctypes.POINTER(wintypes.DWORD),
+                                 wintypes.LPVOID]
+    _DeviceIoControl.restype = wintypes.BOOL
+
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+
+    _RemoveDirectoryW = _kernel32.RemoveDirectoryW
+    _RemoveDirectoryW.argtypes = [wintypes.LPCWSTR]
+    _RemoveDirectoryW.restype = wintypes.BOOL
+
+    INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+
+def _get_file_attributes(path: str) -> int:
+    """Return the Win32 attribute bits for path, or INVALID_FILE_ATTRIBUTES"""
+    if sys.platform == "win32":
+        return _GetFileAttributesW(path)
+
+    # Elsewhere emulate the directory bit from a single stat
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return INVALID_FILE_ATTRIBUTES
+    return FILE_ATTRIBUTE_DIRECTORY if stat.S_ISDIR(st.st_mode) else 0
+
+
+def fast_exists(path: str) -> bool:
+    """Check if something exists at path with a single attribute query"""
+    return _get_file_attributes(path) != INVALID_FILE_ATTRIBUTES
+
+
+def fast_isdir(path: str) -> bool:
+    """Check if path is an existing directory with a single attribute query"""
+    attributes = _get_file_attributes(path)
+    return attributes != INVALID_FILE_ATTRIBUTES and \
+        bool(attributes & FILE_ATTRIBUTE_DIRECTORY)
+
+
+def _read_reparse_data(path: str) -> Optional[bytes]:
+    """
+    Read the raw REPARSE_DATA_BUFFER of a reparse point
+
+    Args:
+        path: Path to the reparse point
+
+    Returns:
+        Buffer contents, or None if path is missing or not a reparse point
+    """
+    handle = _CreateFileW(path, 0, FILE_SHARE_ALL, None, OPEN_EXISTING,
+                          FILE_FLAG_BACKUP_SEMANTICS | FILE_FLAG_OPEN_REPARSE_POINT,
+                          None)
+    if handle == INVALID_HANDLE_VALUE:
+        return None
+
+    try:
+        buffer = ctypes.create_string_buffer(MAXIMUM_REPARSE_DATA_BUFFER_SIZE)
+        returned = wintypes.DWORD(0)
+        if not _DeviceIoControl(handle, FSCTL_GET_REPARSE_POINT, None, 0,
+                                buffer, len(buffer), ctypes.byref(returned), None):
+            return None
+        return buffer.raw[:returned.value]
+    finally:
+        _CloseHandle(handle)
+
+
+def _build_mount_point_buffer(target: str) -> bytes:
+    """
+    Build a mount point REPARSE_DATA_BUFFER pointing at target
+
+    Args:
+        target: Absolute target directory path
+
+    Returns:
+        Reparse buffer ready for FSCTL_SET_REPARSE_POINT
+    """
+    substitute_name = ('\\??\\' + target).encode('utf-16-le')
+    print_name = target.encode('utf-16-le')
+    path_buffer = substitute_name + b'\0\0' + print_name + b'\0\0'
+
+    header = struct.pack('<LHHHHHH',
+                         IO_REPARSE_TAG_MOUNT_POINT,
+                         8 + len(path_buffer),  # ReparseDataLength
+                         0,                     # Reserved
+                         0, len(substitute_name),
+                         len(substitute_name) + 2, len(print_name))
+    return header + path_buffer
+
+
+def _set_mount_point(path: str, target: str):
+    """
+    Turn the empty directory at path into a junction pointing at target
+
+    Raises:
+        OSError: If the directory cannot be opened or the reparse point set
+    """
+    handle = _CreateFileW(path, GENERIC_WRITE, 0, None, OPEN_EXISTING,
+                          FILE_FLAG_BACKUP_SEMANTICS | FILE_FLAG_OPEN_REPARSE_POINT,
+                          None)
+    if handle == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    try:
+        buffer = _build_mount_point_buffer(target)
+        returned = wintypes.DWORD(0)
+        if not _DeviceIoControl(handle, FSCTL_SET_REPARSE_POINT, buffer, len(buffer),
+                                None, 0, ctypes.byref(returned), None):
+            raise ctypes.WinError(ctypes.get_last_error())
+    finally:
+        _CloseHandle(handle)
+
+
+def _reparse_tag(data: bytes) -> int:
+    """Extract the ReparseTag from a REPARSE_DATA_BUFFER"""
+    return struct.unpack_from('<L', data, 0)[0]
+
+
+def _parse_mount_point_target(data: bytes) -> Optional[str]:
+    """
+    Decode the substitute name of a mount point REPARSE_DATA_BUFFER
+
+    Args:
+        data: Raw reparse buffer
+
+    Returns:
+        Junction target path without the NT prefix, or None
+    """
+    if len(data) < 16 or _reparse_tag(data) != IO_REPARSE_TAG_MOUNT_POINT:
+        return None
+
+    # MountPointReparseBuffer: SubstituteNameOffset/Length, PrintNameOffset/Length
+    offset, length = struct.unpack_from('<HH', data, 8)
+    start = 16 + offset
+    target = data[start:start + length].decode('utf-16-le')
+
+    if target.startswith('\\??\\'):
+        target = target[4:]
+    return target or None
+
+
+# Current user and their profile folder, fixed for the life of the process
+_USERNAME = os.environ.get('USERNAME') or os.environ.get('USER')
+_USER_FOLDER = f"C:\\Users\\{_USERNAME}" if _USERNAME else None
+
+# OneDrive folder names under the user profile, lowercased, in order of preference
+_ONEDRIVE_FOLDER_NAMES = (
+    'onedrive',
+    'onedrive - personal',
+    'onedrive - business',
+    'onedrive for business',
+)
+
+
+# Detected OneDrive folders by user profile folder. Only hits are kept, so
+# a OneDrive set up while the tool is running is still found later
+_onedrive_paths = {}
+
+
+def _detect_onedrive_path(user_folder: str) -> Optional[str]:
+    """
+    Find the OneDrive folder, reusing it once it has been found
+
+    Args:
+        user_folder: The user's profile folder, e.g. C:\\Users\\<name>
+
+    Returns:
+        OneDrive folder path if found, None otherwise
+    """
+    onedrive_path = _onedrive_paths.get(user_folder)
+    if onedrive_path is not None:
+        return onedrive_path
+
+    onedrive_path = _find_onedrive_path(user_folder)
+    if onedrive_path is not None:
+        _onedrive_paths[user_folder] = onedrive_path
+    return onedrive_path
+
+
+def _find_onedrive_path(user_folder: str) -> Optional[str]:
+    """Probe the profile folder and registry for the OneDrive folder"""
+    # Check common OneDrive locations with one listing of the profile
+    # folder; scandir entries carry their attributes, so no extra stats
+    found = {}
+    try:
+        with os.scandir(user_folder) as entries:
+            for entry in entries:
+                if entry.name.lower().startswith('onedrive') and entry.is_dir():
+                    found[entry.name.lower()] = entry.path
+    except OSError:
+        pass
+
+    for name in _ONEDRIVE_FOLDER_NAMES:
+        if name in found:
+            return found[name]
+
+    # Try to detect from registry
+    if sys.platform == "win32":
+        try:
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\OneDrive",
+                                0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY) as key:
+                onedrive_path = winreg.QueryValueEx(key, "UserFolder")[0]
+
+            if fast_exists(onedrive_path):
+                return onedrive_path
+        except Exception:
+            pass
 
-from core.powershell import PowerShellExecutor
+    return None
+
+
+def _stat_mtime(path: str) -> Optional[int]:
+    """Return the path's mtime in nanoseconds, or None if it can't be read"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except (OSError, ValueError):
+        return None
+
+
+def _copy_result(result: tuple) -> tuple:
+    """Copy a validation result so callers can't mutate a cached state dict"""
+    return tuple(dict(item) if isinstance(item, dict) else item
+                 for item in result)
 
 
 class PathUtils:
     """Utility class for Windows path operations"""
 
+    # Validation results are reused for this many seconds while the path's
+    # modification time stays the same, and at most this many are kept
+    _VALIDATE_TTL = 2.0
+    _VALIDATE_CACHE_MAX = 64
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.powershell = PowerShellExecutor()
+        # (OneDrive path, normalized folder, folder prefix), see _is_onedrive_path
+        self._onedrive_resolved = None
+        # (kind, normalized path) -> (timestamp, mtime, valid result), see _cached_validation
+        self._validate_cache = {}
 
     def validate_source_path(self, path: str) -> Tuple[bool, str]:
         """
@@ -29,34 +307,85 @@ class PathUtils:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        return self._cached_validation('source', path, self._check_source_path)
+
+    def _cached_validation(self, kind: str, path: str, check):
+        """
+        Run a validation check, reusing a recent result for an unchanged path
+
+        Args:
+            kind: Cache namespace ('source' or 'target')
+            path: Path to validate
+            check: Validation function taking the path
+
+        Returns:
+            Whatever check returns
+        """
+        if not path or not path.strip():
+            return check(path)
+
+        key = (kind, os.path.normcase(os.path.abspath(path)))
+        cached = self._validate_cache.get(key)
+        if cached is not None:
+            # One stat tells whether the path changed since the cached result
+            if time.monotonic() - cached[0] < self._VALIDATE_TTL \
+                    and cached[1] == _stat_mtime(path):
+                return _copy_result(cached[2])
+            del self._validate_cache[key]
+
+        result = check(path)
+
+        # Only successful checks of existing paths are reused. A failure may
+        # clear up without the path's own mtime changing (parent created,
+        # permissions or free space changed), so it is always re-checked.
+        if result[0]:
+            mtime = _stat_mtime(path)
+            if mtime is not None:
+                if len(self._validate_cache) >= self._VALIDATE_CACHE_MAX:
+                    self._validate_cache.clear()
+                self._validate_cache[key] = (
+                    time.monotonic(), mtime, _copy_result(result))
+        return result
+
+    def clear_validation_cache(self):
+        """Forget cached validation results, e.g. after moving folders around"""
+        self._validate_cache.clear()
+
+    def _check_source_path(self, path: str) -> Tuple[bool, str]:
+        """Validate source path, see validate_source_path"""
         try:
             if not path or not path.strip():
                 return False, "Source path cannot be empty"
 
             source_path = Path(path)
 
+            # One attribute query answers both existence and type
+            attributes = _get_file_attributes(path)
+
             # Check if path exists
-            if not source_path.exists():
+            if attributes == INVALID_FILE_ATTRIBUTES:
                 return False, "Source path does not exist"
 
             # Check if it's a directory
-            if not source_path.is_dir():
+            if not attributes & FILE_ATTRIBUTE_DIRECTORY:
                 return False, "Source path must be a directory"
 
             # Check read permissions
             if not os.access(source_path, os.R_OK):
                 return False, "No read permission for source path"
 
-            # Check if path is accessible
+            # Check if path is accessible, opening the listing and reading
+            # at most one entry is enough to surface permission errors
             try:
-                list(source_path.iterdir())
+                with os.scandir(path) as entries:
+                    next(entries, None)
             except PermissionError:
                 return False, "Source path is not accessible (permission denied)"
             except Exception as e:
                 return False, f"Source path is not accessible: {str(e)}"
 
             # Check path length (Windows limitation)
-            if len(str(source_path.resolve())) > 260:
+            if len(os.path.normpath(os.path.abspath(path))) > 260:
                 return False, "Source path is too long (Windows path limit: 260 characters)"
 
             return True, ""
@@ -75,60 +404,82 @@ class PathUtils:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        is_valid, error_msg, _ = self.validate_target_path_detailed(path)
+        return is_valid, error_msg
+
+    def validate_target_path_detailed(self, path: str) -> Tuple[bool, str, Optional[dict]]:
+        """
+        Validate target path and report what the checks found about it
+
+        Args:
+            path: Target OneDrive path
+
+        Returns:
+            Tuple of (is_valid, error_message, state), where state is
+            {'existed': bool, 'empty': bool} for a valid target and None otherwise
+        """
+        return self._cached_validation('target', path, self._check_target_path)
+
+    def _check_target_path(self, path: str) -> Tuple[bool, str, Optional[dict]]:
+        """Validate target path, see validate_target_path_detailed"""
         try:
             if not path or not path.strip():
-                return False, "Target path cannot be empty"
+                return False, "Target path cannot be empty", None
 
             target_path = Path(path)
+            state = {'existed': False, 'empty': True}
 
-            # Check if target already exists
-            if target_path.exists():
-                if target_path.is_file():
-                    return False, "Target path is a file, not a directory"
-                # If it's a directory, check if it's empty or we can merge
-                try:
-                    # Check if directory is empty
-                    if not any(target_path.iterdir()):
-                        self.logger.info(
-                            f"Target directory is empty: {target_path}")
-                    else:
-                        # Directory has contents, but we can still merge
-                        self.logger.info(
-                            f"Target directory exists with contents, will merge: {target_path}")
-                except PermissionError:
-                    return False, "Cannot access target directory to check contents"
+            # Check if target already exists, is a directory and whether it
+            # is empty, all from opening one listing
+            try:
+                with os.scandir(path) as entries:
+                    is_empty = next(entries, None) is None
+            except NotADirectoryError:
+                return False, "Target path is a file, not a directory", None
+            except FileNotFoundError:
+                # Target absent, fall through to the parent checks
+                pass
+            except PermissionError:
+                return False, "Cannot access target directory to check contents", None
+            else:
+                state = {'existed': True, 'empty': is_empty}
+                if is_empty:
+                    self.logger.info(
+                        f"Target directory is empty: {target_path}")
+                else:
+                    # Directory has contents, but we can still merge
+                    self.logger.info(
+                        f"Target directory exists with contents, will merge: {target_path}")
 
             # Check if parent directory exists
             parent_dir = target_path.parent
-            if not parent_dir.exists():
-                return False, "Target parent directory does not exist"
+            if not fast_exists(str(parent_dir)):
+                return False, "Target parent directory does not exist", None
 
             # Check write permissions on parent directory
             if not os.access(parent_dir, os.W_OK):
-                return False, "No write permission for target parent directory"
+                return False, "No write permission for target parent directory", None
 
             # Check available disk space (basic check)
             if not self._check_disk_space(parent_dir):
-                return False, "Insufficient disk space at target location"
+                return False, "Insufficient disk space at target location", None
 
             # Check path length (Windows limitation)
-            if len(str(target_path.resolve())) > 260:
-                return False, "Target path is too long (Windows path limit: 260 characters)"
+            if len(os.path.normpath(os.path.abspath(path))) > 260:
+                return False, "Target path is too long (Windows path limit: 260 characters)", None
 
-            # Check if target is in OneDrive folder (optional warning)
-            if not self._is_onedrive_path(target_path):
-                # This is a warning, not an error
-                pass
+            # Being outside OneDrive is only a warning, callers that show it
+            # check _is_onedrive_path themselves
 
-            return True, ""
+            return True, "", state
 
         except Exception as e:
             self.logger.error(f"Target path validation error: {e}")
-            return False, f"Path validation error: {str(e)}"
+            return False, f"Path validation error: {str(e)}", None
 
     def is_junction(self, path: str) -> bool:
         """
-        Check if path is a junction point using PowerShell
+        Check if path is a junction point by reading its reparse tag
 
         Args:
             path: Path to check
@@ -137,105 +488,203 @@ class PathUtils:
             True if path is a junction point
         """
         try:
-            if not path or not Path(path).exists():
+            if not path or sys.platform != "win32":
                 return False
 
-            # Use PowerShell to check if it's a junction
-            ps_command = f"Get-Item '{path}' | Where-Object {{$_.LinkType -eq 'Junction'}} | Select-Object -First 1"
-            success, output, error = self.powershell.run_command(ps_command)
+            # Cheap attribute probe first; most paths are not reparse points
+            attributes = _get_file_attributes(path)
+            if attributes == INVALID_FILE_ATTRIBUTES or \
+                    not attributes & FILE_ATTRIBUTE_REPARSE_POINT:
+                return False
 
-            if success and output.strip():
-                return True
-            return False
+            data = _read_reparse_data(path)
+            return data is not None and \
+                _reparse_tag(data) == IO_REPARSE_TAG_MOUNT_POINT
 
         except Exception as e:
             self.logger.error(
                 f"Error checking junction status for {path}: {e}")
             return False
 
-    def get_junction_target(self, path: str) -> Optional[str]:
+    def is_junction_entry(self, entry: os.DirEntry) -> bool:
         """
-        Get junction target path using PowerShell
+        Check if a scandir entry is a junction point without extra syscalls
 
         Args:
-            path: Junction path
+            entry: Directory entry from os.scandir
 
         Returns:
-            Target path if junction, None otherwise
+            True if entry is a junction point
         """
         try:
-            if not self.is_junction(path):
-                return None
+            if hasattr(entry, 'is_junction'):
+                # Python 3.12+
+                return entry.is_junction()
+
+            # The lstat result is cached from the directory scan on Windows
+            st = entry.stat(follow_symlinks=False)
+            return getattr(st, 'st_reparse_tag', 0) == IO_REPARSE_TAG_MOUNT_POINT
+        except OSError:
+            return False
 
-            # Use PowerShell to get junction target
-            ps_command = f"Get-Item '{path}' | Select-Object -ExpandProperty Target"
-            success, output, error = self.powershell.run_command(ps_command)
+    def is_link_entry(self, entry: os.DirEntry) -> bool:
+        """
+        Check if a scandir entry redirects to another location (junction or symlink)
 
-            if success and output.strip():
-                return output.strip()
-            return None
+        Only name-surrogate reparse points count as links, other reparse points
+        such as OneDrive placeholders are ordinary folders.
+
+        Args:
+            entry: Directory entry from os.scandir
+
+        Returns:
+            True if entry is a symlink or name-surrogate reparse point
+        """
+        try:
+            if entry.is_symlink():
+                return True
+
+            # The lstat result is cached from the directory scan on Windows
+            st = entry.stat(follow_symlinks=False)
+            return bool(getattr(st, 'st_reparse_tag', 0) & IO_REPARSE_TAG_NAME_SURROGATE_BIT)
+        except OSError:
+            return False
+
+    def get_junction_info_atomic(self, path: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check junction status and read its target with a single handle open
+
+        Args:
+            path: Path to check
+
+        Returns:
+            Tuple of (is_junction, target)
+        """
+        try:
+            if not path or sys.platform != "win32":
+                return False, None
+
+            data = _read_reparse_data(path)
+            if data is None or _reparse_tag(data) != IO_REPARSE_TAG_MOUNT_POINT:
+                return False, None
+
+            return True, _parse_mount_point_target(data)
 
         except Exception as e:
-            self.logger.error(f"Error getting junction target for {path}: {e}")
-            return None
+            self.logger.error(f"Error reading junction info for {path}: {e}")
+            return False, None
 
-    def get_onedrive_path(self) -> Optional[str]:
+    def create_junction(self, source: str, target: str) -> Tuple[bool, str]:
         """
-        Auto-detect OneDrive folder path
+        Create a junction at source pointing to target without spawning PowerShell
+
+        Args:
+            source: Junction path to create (must not exist)
+            target: Existing target directory
 
         Returns:
-            OneDrive folder path if found, None otherwise
+            Tuple of (success, error_message)
         """
+        if sys.platform != "win32":
+            return False, "Junction links are only supported on Windows"
+
+        created_dir = False
         try:
-            # Check common OneDrive locations
-            username = os.getenv('USERNAME')
-            if not username:
-                return None
+            os.mkdir(source)
+            created_dir = True
+            _set_mount_point(source, os.path.abspath(target))
+            return True, ""
 
-            possible_paths = [
-                f"C:\\Users\\{username}\\OneDrive",
-                f"C:\\Users\\{username}\\OneDrive - Personal",
-                f"C:\\Users\\{username}\\OneDrive - Business",
-                f"C:\\Users\\{username}\\OneDrive for Business",
-            ]
+        except OSError as e:
+            # Don't leave a plain empty directory behind
+            if created_dir:
+                try:
+                    os.rmdir(source)
+                except OSError:
+                    pass
+            self.logger.error(f"Error creating junction {source}: {e}")
+            return False, str(e)
 
-            for path_str in possible_paths:
-                path = Path(path_str)
-                if path.exists() and path.is_dir():
-                    return str(path)
+    def remove_junction(self, path: str) -> Tuple[bool, str]:
+        """
+        Remove a junction link without touching its target
 
-            # Try to detect from registry
-            try:
-                import winreg
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                                     r"Software\\Microsoft\\OneDrive")
-                onedrive_path = winreg.QueryValueEx(key, "UserFolder")[0]
-                winreg.CloseKey(key)
+        RemoveDirectoryW deletes the reparse point itself and never follows
+        it. Callers must verify path is a junction first, otherwise an empty
+        real directory would be removed.
 
-                if Path(onedrive_path).exists():
-                    return onedrive_path
-            except Exception:
-                pass
+        Args:
+            path: Junction path
 
-            return None
+        Returns:
+            Tuple of (success, error_message)
+        """
+        if sys.platform != "win32":
+            return False, "Junction links are only supported on Windows"
+
+        if not _RemoveDirectoryW(path):
+            error = ctypes.WinError(ctypes.get_last_error())
+            self.logger.error(f"Error removing junction {path}: {error}")
+            return False, str(error)
+        return True, ""
+
+    def get_junction_target(self, path: str) -> Optional[str]:
+        """
+        Get junction target path from its reparse data
+
+        Args:
+            path: Junction path
+
+        Returns:
+            Target path if junction, None otherwise
+        """
+        # Checks the reparse tag and decodes the target from one handle
+        _, target = self.get_junction_info_atomic(path)
+        return target
+
+    def get_onedrive_path(self) -> Optional[str]:
+        """
+        Auto-detect OneDrive folder path
+
+        A found path is cached for the process, see invalidate_onedrive_cache.
+
+        Returns:
+            OneDrive folder path if found, None otherwise
+        """
+        try:
+            if not _USER_FOLDER:
+                return None
+
+            return _detect_onedrive_path(_USER_FOLDER)
 
         except Exception as e:
             self.logger.error(f"Error detecting OneDrive path: {e}")
             return None
 
-    def _is_onedrive_path(self, path: Path) -> bool:
-        """Check if path is within OneDrive folder"""
+    def invalidate_onedrive_cache(self):
+        """Forget the detected OneDrive path, e.g. after OneDrive is set up"""
+        _onedrive_paths.clear()
+
+    def _is_onedrive_path(self, path) -> bool:
+        """Check if path (str or Path) is within OneDrive folder"""
         try:
             onedrive_path = self.get_onedrive_path()
             if not onedrive_path:
                 return False
 
-            onedrive_path_obj = Path(onedrive_path)
-            try:
-                path.resolve().relative_to(onedrive_path_obj.resolve())
-                return True
-            except ValueError:
-                return False
+            # Normalize the OneDrive side once per detected folder; abspath
+            # and normpath are string operations, unlike resolve(), and
+            # normcase folds case on Windows
+            cached = self._onedrive_resolved
+            if cached is None or cached[0] != onedrive_path:
+                root = os.path.normcase(
+                    os.path.normpath(os.path.abspath(onedrive_path)))
+                cached = (onedrive_path, root, root.rstrip(os.sep) + os.sep)
+                self._onedrive_resolved = cached
+
+            normalized = os.path.normcase(
+                os.path.normpath(os.path.abspath(path)))
+            return normalized == cached[1] or normalized.startswith(cached[2])
         except Exception:
             return False
 
@@ -251,24 +700,9 @@ class PathUtils:
             True if sufficient space available
         """
         try:
-            if sys.platform == "win32":
-                import ctypes
-
-                free_bytes = ctypes.c_ulonglong(0)
-                ctypes.windll.kernel32.GetDiskFreeSpaceExW(
-                    ctypes.c_wchar_p(str(path)),
-                    ctypes.pointer(free_bytes),
-                    None,
-                    None
-                )
-
-                free_mb = free_bytes.value / (1024 * 1024)
-                return free_mb >= min_space_mb
-            else:
-                # Fallback for non-Windows systems
-                statvfs = os.statvfs(path)
-                free_mb = (statvfs.f_frsize * statvfs.f_bavail) / (1024 * 1024)
-                return free_mb >= min_space_mb
+            # GetDiskFreeSpaceExW on Windows, statvfs elsewhere
+            free_bytes = shutil.disk_usage(str(path)).free
+            return free_bytes >= min_space_mb * 1024 * 1024
 
         except Exception as e:
             self.logger.error(f"Error checking disk space: {e}")
@@ -276,13 +710,28 @@ class PathUtils:
 
     def normalize_path(self, path: str) -> str:
         """
-        Normalize Windows path
+        Normalize Windows path without touching the filesystem
 
         Args:
             path: Path to normalize
 
         Returns:
-            Normalized path
+            Absolute path with redundant separators and dots removed
+        """
+        try:
+            return os.path.normpath(os.path.abspath(path))
+        except Exception:
+            return path
+
+    def resolve_path(self, path: str) -> str:
+        """
+        Resolve path through the filesystem, following links
+
+        Args:
+            path: Path to resolve
+
+        Returns:
+            Canonical path
         """
         try:
             return str(Path(path).resolve())
@@ -299,24 +748,12 @@ class PathUtils:
         Returns:
             Safe filename
         """
-        # Remove invalid characters for Windows
-        invalid_chars = '<>:"/\\|?*'
-        safe_name = filename
-
-        for char in invalid_chars:
-            safe_name = safe_name.replace(char, '_')
-
-        # Remove trailing dots and spaces
-        safe_name = safe_name.rstrip('. ')
+        # Replace invalid characters for Windows in one pass, then
+        # remove trailing dots and spaces
+        safe_name = filename.translate(_UNSAFE_TABLE).rstrip('. ')
 
         # Check for reserved names
-        reserved_names = [
-            'CON', 'PRN', 'AUX', 'NUL',
-            'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-            'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-        ]
-
-        if safe_name.upper() in reserved_names:
+        if safe_name.upper() in _RESERVED_NAMES:
             safe_name = f"_{safe_name}"
 
         return safe_name